@@ -29,11 +29,13 @@ setup(
         "torch>=1.9.0",
         "transformers>=4.30.0",
         "pandas>=1.3.0",
+        "pyarrow>=10.0.0",
         "numpy>=1.21.0",
         "scikit-learn>=1.0.0",
         "matplotlib>=3.4.0",
         "seaborn>=0.11.0",
         "pyyaml>=5.4.0",
+        "fastjsonschema>=2.15.0",
         "tqdm>=4.62.0",
         "jupyter>=1.0.0",
         "ipywidgets>=7.6.0",
@@ -41,6 +43,7 @@ setup(
     extras_require={
         "dev": [
             "pytest>=6.2.0",
+            "pytest-xdist>=2.5.0",
             "black>=21.0",
             "flake8>=3.9.0",
             "pre-commit>=2.15.0",
@@ -48,5 +51,12 @@ setup(
         "colab": [
             "google-colab",
         ],
+        "fast": [
+            "orjson>=3.6.0",
+            "ijson>=3.1.0",
+            "zstandard>=0.15.0",
+            "pyahocorasick>=2.0.0",
+            "hyperscan>=0.4.0; platform_machine == 'x86_64'",
+        ],
     },
 )
\ No newline at end of file
@@ -2,8 +2,10 @@
 Configuration management system
 """
 
-import yaml
+import hashlib
 import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 import logging
@@ -11,6 +13,32 @@ import sys
 
 logger = logging.getLogger(__name__)
 
+# JSON Schemas describing the structure of each known config
+_SCHEMA_DIR = Path(__file__).resolve().parent.parent / "configs" / "schemas"
+
+# Set to bypass the parsed-YAML sidecar cache (e.g. for CI correctness checks)
+_DISABLE_CACHE_ENV = 'SPAM_NEWS_DISABLE_YAML_CACHE'
+
+# data_config keys exposed as paths by get_paths
+_PATH_KEYS = ('data_dir', 'articles_file', 'sample_articles', 'processed_data',
+              'cache_dir', 'models_dir', 'results_dir', 'logs_dir')
+
+
+@lru_cache(maxsize=None)
+def _yaml_backend():
+    """Import PyYAML on first use, preferring the libyaml-backed loader/dumper"""
+    import yaml
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+    return yaml, loader, dumper
+
+
+@lru_cache(maxsize=None)
+def _schema_backend():
+    """Import fastjsonschema on first validation"""
+    import fastjsonschema
+    return fastjsonschema
+
 
 class ConfigManager:
     """Manages configuration loading and validation"""
@@ -24,6 +52,8 @@ class ConfigManager:
         """
         self.config_dir = Path(config_dir)
         self._configs = {}
+        self._paths = None
+        self._validators = {}
         self._environment = self._detect_environment()
         
     def _detect_environment(self) -> str:
@@ -48,22 +78,25 @@ class ConfigManager:
             return self._configs[config_name]
         
         # Try to find config file
+        # List the directory once instead of stat-ing each extension
+        # (each stat is a round trip on a mounted Google Drive)
+        try:
+            with os.scandir(self.config_dir) as entries:
+                existing = {entry.name for entry in entries}
+        except OSError:
+            existing = set()
+        
         config_path = None
         for ext in ['.yaml', '.yml', '.json']:
-            candidate = self.config_dir / f"{config_name}{ext}"
-            if candidate.exists():
-                config_path = candidate
+            if f"{config_name}{ext}" in existing:
+                config_path = self.config_dir / f"{config_name}{ext}"
                 break
         
         if not config_path:
             raise FileNotFoundError(f"Config file not found: {config_name}")
         
         # Load config
-        with open(config_path, 'r') as f:
-            if config_path.suffix in ['.yaml', '.yml']:
-                config = yaml.safe_load(f)
-            else:
-                config = json.load(f)
+        config = self._read_config_file(config_path)
         
         # Apply environment-specific overrides
         config = self._apply_environment_overrides(config)
@@ -77,6 +110,40 @@ class ConfigManager:
         
         return config
     
+    def _read_config_file(self, config_path: Path) -> Dict[str, Any]:
+        """Read a config file, caching parsed YAML in a JSON sidecar"""
+        if config_path.suffix not in ['.yaml', '.yml']:
+            with open(config_path, 'r') as f:
+                return json.load(f)
+        
+        # Reuse the sidecar while it matches the YAML source's content hash
+        raw = config_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        cache_path = config_path.with_name(f".{config_path.stem}.cache.json")
+        use_cache = not os.environ.get(_DISABLE_CACHE_ENV)
+        if use_cache and cache_path.exists():
+            try:
+                with open(cache_path, 'r') as f:
+                    cached = json.load(f)
+                if isinstance(cached, dict) and cached.get('sha256') == digest:
+                    return cached['config']
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Ignoring unreadable config cache {cache_path}: {e}")
+        
+        yaml, loader, _ = _yaml_backend()
+        config = yaml.load(raw, Loader=loader)
+        
+        # Only cache configs that survive a JSON round trip unchanged
+        if use_cache:
+            try:
+                payload = json.dumps({'sha256': digest, 'config': config})
+                if json.loads(payload)['config'] == config:
+                    cache_path.write_text(payload)
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning(f"Could not write config cache {cache_path}: {e}")
+        
+        return config
+    
     def _apply_environment_overrides(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Apply environment-specific configuration overrides"""
         # For data config, use environment-specific paths
@@ -89,23 +156,35 @@ class ConfigManager:
         
         return config
     
+    def _get_validator(self, config_name: str):
+        """Get the compiled schema validator for a config (None if unschematized)"""
+        if config_name not in self._validators:
+            schema_path = _SCHEMA_DIR / f"{config_name}.yaml"
+            validator = None
+            if schema_path.exists():
+                validator = _schema_backend().compile(self._read_config_file(schema_path))
+            self._validators[config_name] = validator
+        
+        return self._validators[config_name]
+    
     def _validate_config(self, config_name: str, config: Dict[str, Any]):
         """Validate configuration based on config type"""
+        # Structure is checked by the compiled JSON Schema validator
+        validator = self._get_validator(config_name)
+        if validator is not None:
+            try:
+                validator(config)
+            except _schema_backend().JsonSchemaException as e:
+                raise ValueError(f"Invalid {config_name}: {e.message}") from e
+        
+        # Value checks that a schema can't express
         if config_name == 'data_config':
             self._validate_data_config(config)
         elif config_name == 'model_config':
             self._validate_model_config(config)
-        elif config_name == 'frame_definitions':
-            self._validate_frame_definitions(config)
     
     def _validate_data_config(self, config: Dict[str, Any]):
         """Validate data configuration"""
-        # Check required sections
-        required_sections = ['loading', 'splitting', 'human_coding', 'metadata']
-        for section in required_sections:
-            if section not in config:
-                raise ValueError(f"Missing required section in data_config: {section}")
-        
         # Validate splitting ratios
         splitting = config['splitting']
         total_ratio = splitting['train_ratio'] + splitting['val_ratio'] + splitting['test_ratio']
@@ -120,12 +199,6 @@ class ConfigManager:
     
     def _validate_model_config(self, config: Dict[str, Any]):
         """Validate model configuration"""
-        # Check required sections
-        required_sections = ['zero_shot', 'fine_tuning', 'preprocessing']
-        for section in required_sections:
-            if section not in config:
-                raise ValueError(f"Missing required section in model_config: {section}")
-        
         # Validate learning rate
         lr = config['fine_tuning']['learning_rate']
         if not (1e-6 <= lr <= 1e-2):
@@ -136,35 +209,15 @@ class ConfigManager:
         if batch_size <= 0 or batch_size > 128:
             logger.warning(f"Batch size {batch_size} seems unusual")
     
-    def _validate_frame_definitions(self, config: Dict[str, Any]):
-        """Validate frame definitions"""
-        # Check that all expected frames are defined
-        expected_frames = ['underrepresentation', 'overrepresentation', 'obstacles', 'successes']
-        frames = config.get('frames', {})
-        
-        for frame in expected_frames:
-            if frame not in frames:
-                raise ValueError(f"Missing frame definition: {frame}")
-            
-            frame_def = frames[frame]
-            if 'definition' not in frame_def:
-                raise ValueError(f"Missing definition for frame: {frame}")
-            if 'keywords' not in frame_def:
-                raise ValueError(f"Missing keywords for frame: {frame}")
-    
     def get_paths(self) -> Dict[str, Path]:
         """Get environment-appropriate paths"""
-        data_config = self.load_config('data_config')
-        
-        paths = {}
-        path_keys = ['data_dir', 'articles_file', 'sample_articles', 'processed_data',
-                    'cache_dir', 'models_dir', 'results_dir', 'logs_dir']
-        
-        for key in path_keys:
-            if key in data_config:
-                paths[key] = Path(data_config[key])
+        if self._paths is None:
+            data_config = self.load_config('data_config')
+            
+            self._paths = {key: Path(data_config[key])
+                           for key in _PATH_KEYS if key in data_config}
         
-        return paths
+        return dict(self._paths)
     
     def get_frame_definitions(self) -> Dict[str, Any]:
         """Get frame definitions"""
@@ -194,15 +247,21 @@ class ConfigManager:
         if config_name not in self._configs:
             self.load_config(config_name)
         
-        def recursive_update(d, u):
+        # Merge with an explicit stack so deep configs cannot hit the recursion limit
+        stack = [(self._configs[config_name], updates)]
+        while stack:
+            d, u = stack.pop()
             for k, v in u.items():
                 if isinstance(v, dict):
-                    d[k] = recursive_update(d.get(k, {}), v)
+                    # Merge into a fresh dict rather than aliasing the caller's
+                    if not isinstance(d.get(k), dict):
+                        d[k] = {}
+                    stack.append((d[k], v))
                 else:
                     d[k] = v
-            return d
         
-        recursive_update(self._configs[config_name], updates)
+        if config_name == 'data_config':
+            self._paths = None
         logger.info(f"Updated config: {config_name}")
     
     def save_config(self, config_name: str, output_path: Optional[Path] = None):
@@ -213,8 +272,9 @@ class ConfigManager:
         if output_path is None:
             output_path = self.config_dir / f"{config_name}.yaml"
         
+        yaml, _, dumper = _yaml_backend()
         with open(output_path, 'w') as f:
-            yaml.safe_dump(self._configs[config_name], f, indent=2)
+            yaml.dump(self._configs[config_name], f, Dumper=dumper, indent=2)
         
         logger.info(f"Saved config: {config_name} to {output_path}")
 
@@ -2,17 +2,109 @@
 Data loading utilities for Google Drive and local files
 """
 
+from __future__ import annotations
+
 import json
-import pandas as pd
+import os
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
 import logging
 import pickle
 import hashlib
-from datetime import datetime
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 logger = logging.getLogger(__name__)
 
+# Leading bytes of a zstd frame (pickles always start with 0x80)
+_ZSTD_MAGIC = b'\x28\xb5\x2f\xfd'
+
+# Articles per DataFrame chunk when building a frame from a stream
+_STREAM_BATCH_SIZE = 1000
+
+# Locations searched for articles when no data path is given
+_POSSIBLE_ARTICLE_PATHS = (
+    Path('data/articles.json'),
+    Path('data/sample_articles.json'),
+    Path('/content/drive/MyDrive/spam_news_data/articles.json'),
+)
+
+# Frame types recognised in human coding
+_FRAME_TYPES = ('underrepresentation', 'overrepresentation', 'obstacles', 'successes')
+
+# Suffix marking Parquet columns that hold JSON-encoded nested values
+_JSON_COLUMN_SUFFIX = '__json'
+
+
+def _first_existing(paths) -> Optional[Path]:
+    """Return the first existing path, listing each parent directory only once"""
+    listings = {}
+    for path in paths:
+        parent = path.parent
+        if parent not in listings:
+            try:
+                with os.scandir(parent) as entries:
+                    listings[parent] = {entry.name for entry in entries}
+            except OSError:
+                listings[parent] = set()
+        if path.name in listings[parent]:
+            return path
+    return None
+
+
+def _hash_key(key_string: str) -> str:
+    """Hash a cache key with blake2b, so keys match across installs"""
+    return hashlib.blake2b(key_string.encode(), digest_size=8).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _get_pd():
+    """Import pandas on first use so path helpers load without it"""
+    import pandas
+    return pandas
+
+
+def _write_parquet(df: pd.DataFrame, path: Union[str, Path]):
+    """Write a DataFrame to zstd-compressed Parquet"""
+    # Nested dicts/lists (e.g. human_coding) would become Arrow structs with
+    # null-filled keys, so store them as JSON text to round-trip exactly
+    renames = {}
+    df = df.copy(deep=False)
+    for col in df.columns[df.dtypes == object]:
+        if df[col].map(lambda v: isinstance(v, (dict, list))).any():
+            df[col] = df[col].map(json.dumps)
+            renames[col] = f"{col}{_JSON_COLUMN_SUFFIX}"
+    
+    df.rename(columns=renames).to_parquet(path, engine='pyarrow', compression='zstd')
+
+
+def _read_parquet(path: Union[str, Path]) -> pd.DataFrame:
+    """Read a DataFrame written by _write_parquet"""
+    pd = _get_pd()
+    with pd.option_context('mode.string_storage', 'pyarrow'):
+        df = pd.read_parquet(path, engine='pyarrow')
+    
+    renames = {}
+    for col in df.columns:
+        if col.endswith(_JSON_COLUMN_SUFFIX):
+            df[col] = df[col].map(json.loads)
+            renames[col] = col[:-len(_JSON_COLUMN_SUFFIX)]
+    
+    return df.rename(columns=renames)
+
 
 class ArticleDataLoader:
     """Loads news articles from various sources including Google Drive"""
@@ -26,6 +118,7 @@ class ArticleDataLoader:
         """
         self.data_path = Path(data_path) if data_path else None
         self._articles = None
+        self._articles_df = None
         self._df = None
         
     def load_from_json(self, filepath: Union[str, Path]) -> List[Dict]:
@@ -34,12 +127,36 @@ class ArticleDataLoader:
         if not filepath.exists():
             raise FileNotFoundError(f"Data file not found: {filepath}")
             
-        with open(filepath, 'r', encoding='utf-8') as f:
-            articles = json.load(f)
+        if orjson is not None:
+            articles = orjson.loads(filepath.read_bytes())
+        else:
+            with open(filepath, 'r', encoding='utf-8') as f:
+                articles = json.load(f)
             
         logger.info(f"Loaded {len(articles)} articles from {filepath}")
         return articles
     
+    def load_from_json_streaming(self, filepath: Union[str, Path]) -> Iterator[Dict]:
+        """
+        Yield articles from a JSON array one at a time
+        
+        Uses ijson when installed so only one article is in memory at once,
+        otherwise falls back to loading the whole file.
+        """
+        filepath = Path(filepath)
+        if not filepath.exists():
+            raise FileNotFoundError(f"Data file not found: {filepath}")
+        
+        try:
+            import ijson
+        except ImportError:
+            logger.warning("ijson not installed, loading full file instead of streaming")
+            yield from self.load_from_json(filepath)
+            return
+        
+        with open(filepath, 'rb') as f:
+            yield from ijson.items(f, 'item', use_float=True)
+    
     def load_from_drive(self, drive_path: str) -> List[Dict]:
         """
         Load articles from Google Drive
@@ -63,43 +180,71 @@ class ArticleDataLoader:
         except ImportError:
             raise RuntimeError("Google Colab not detected. Use load_from_json for local files.")
     
-    def load_articles(self, source: Optional[str] = None) -> pd.DataFrame:
+    def load_articles(self, source: Optional[str] = None, streaming: bool = False) -> pd.DataFrame:
         """
         Load articles and return as DataFrame
         
         Args:
             source: Optional source to filter by
+            streaming: Build the DataFrame in chunks from articles streamed
+                one at a time, without keeping the parsed JSON list around
+        
+        Returns:
+            A copy of the loaded articles, safe to modify
         """
-        if self._articles is None:
-            if self.data_path:
-                self._articles = self.load_from_json(self.data_path)
+        # All articles, converted once; source filters apply to this frame
+        df = self._articles_df
+        if df is None:
+            # Try to find data if no path was given
+            path = self.data_path or _first_existing(_POSSIBLE_ARTICLE_PATHS)
+            if path is None:
+                raise FileNotFoundError("No data file found in common locations")
+            
+            if streaming:
+                # Convert fixed-size chunks so only one chunk of article
+                # dicts is alive at a time
+                stream = self.load_from_json_streaming(path)
+                frames = []
+                while batch := list(islice(stream, _STREAM_BATCH_SIZE)):
+                    frames.append(self._articles_frame(batch))
+                df = _get_pd().concat(frames, ignore_index=True) if frames else self._articles_frame([])
             else:
-                # Try to find data
-                possible_paths = [
-                    Path('data/articles.json'),
-                    Path('data/sample_articles.json'),
-                    Path('/content/drive/MyDrive/spam_news_data/articles.json')
-                ]
-                
-                for path in possible_paths:
-                    if path.exists():
-                        self._articles = self.load_from_json(path)
-                        break
-                else:
-                    raise FileNotFoundError("No data file found in common locations")
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(self._articles)
+                self._articles = self.load_from_json(path)
+                df = self._articles_frame(self._articles)
+            
+            # Low-cardinality labels compare and count as small integer codes
+            df['source'] = df['source'].astype('category')
+            
+            # Add useful columns
+            content = df['content'].str
+            df['content_length'] = content.len()
+            # str.split() whitespace rules; a regex \S+ count differs by engine
+            # on characters such as NBSP and \v
+            df['word_count'] = content.split().str.len()
+            
+            self._articles_df = df
         
         # Filter by source if specified
         if source:
-            df = df[df['source'] == source]
-            
-        # Add useful columns
-        df['content_length'] = df['content'].str.len()
-        df['word_count'] = df['content'].str.split().str.len()
+            df = df[df['source'] == source].copy()
+            df['source'] = df['source'].cat.remove_unused_categories()
         
+        # Callers get their own copy, so changes to it (new columns, in-place
+        # fillna) never reach the cached frame or the accessors below; the
+        # Arrow text columns are immutable and shared rather than duplicated
         self._df = df
+        return df.copy()
+    
+    @staticmethod
+    def _articles_frame(articles: List[Dict]) -> pd.DataFrame:
+        """Build a DataFrame from article dicts with Arrow-backed text columns"""
+        df = _get_pd().DataFrame.from_records(articles)
+        
+        # Arrow-backed strings share contiguous buffers instead of one Python
+        # object per cell, and keep the .str methods in Arrow compute
+        for col in ('article_id', 'date', 'title', 'content'):
+            if col in df.columns:
+                df[col] = df[col].astype('string[pyarrow]')
         return df
     
     def get_coding_data(self) -> pd.DataFrame:
@@ -107,20 +252,22 @@ class ArticleDataLoader:
         if self._df is None:
             self.load_articles()
             
-        records = []
-        for idx, row in self._df.iterrows():
-            coding = row['human_coding']
-            for frame_type, demographics in coding.items():
-                for demo_group, count in demographics.items():
-                    records.append({
-                        'article_id': row['article_id'],
-                        'source': row['source'],
-                        'frame_type': frame_type,
-                        'demographic_group': demo_group,
-                        'count': count
-                    })
-        
-        return pd.DataFrame(records)
+        # Plain tuples avoid boxing each row in a Series or a dict
+        rows = self._df[['article_id', 'source', 'human_coding']].itertuples(index=False, name=None)
+        records = [
+            (article_id, source, frame_type, demo_group, count)
+            for article_id, source, coding in rows
+            for frame_type, demographics in coding.items()
+            for demo_group, count in demographics.items()
+        ]
+        
+        coding_df = _get_pd().DataFrame.from_records(
+            records, columns=['article_id', 'source', 'frame_type', 'demographic_group', 'count']
+        )
+        for col in ('source', 'frame_type', 'demographic_group'):
+            coding_df[col] = coding_df[col].astype('category')
+        
+        return coding_df
     
     def get_train_val_test_split(self, val_size: float = 0.2, test_size: float = 0.2, 
                                    random_state: int = 42):
@@ -135,31 +282,43 @@ class ArticleDataLoader:
         if self._df is None:
             self.load_articles()
             
-        # Shuffle
-        df_shuffled = self._df.sample(frac=1, random_state=random_state).reset_index(drop=True)
+        import numpy as np
+        
+        # Shuffle row positions only, so each split copies just its own rows
+        rng = np.random.default_rng(random_state)
+        order = rng.permutation(len(self._df))
         
         # Calculate split indices
-        test_idx = int(len(df_shuffled) * (1 - test_size))
+        test_idx = int(len(order) * (1 - test_size))
         val_idx = int(test_idx * (1 - val_size))
         
         # Split
-        train_df = df_shuffled[:val_idx]
-        val_df = df_shuffled[val_idx:test_idx]
-        test_df = df_shuffled[test_idx:]
+        train_df = self._df.iloc[order[:val_idx]]
+        val_df = self._df.iloc[order[val_idx:test_idx]]
+        test_df = self._df.iloc[order[test_idx:]]
         
         logger.info(f"Train: {len(train_df)}, Val: {len(val_df)}, Test: {len(test_df)} articles")
         
         return train_df, val_df, test_df
     
-    def save_preprocessed(self, save_path: Union[str, Path], format: str = 'pickle'):
-        """Save preprocessed data for faster loading"""
+    def save_preprocessed(self, save_path: Union[str, Path], format: str = 'parquet'):
+        """
+        Save preprocessed data for faster loading
+        
+        Args:
+            save_path: Destination file
+            format: One of 'parquet' (the default; earlier versions wrote
+                pickle), 'pickle', 'csv' or 'json'
+        """
         save_path = Path(save_path)
         save_path.parent.mkdir(parents=True, exist_ok=True)
         
         if self._df is None:
             self.load_articles()
             
-        if format == 'pickle':
+        if format == 'parquet':
+            _write_parquet(self._df, save_path)
+        elif format == 'pickle':
             self._df.to_pickle(save_path)
         elif format == 'csv':
             self._df.to_csv(save_path, index=False)
@@ -169,6 +328,40 @@ class ArticleDataLoader:
             raise ValueError(f"Unknown format: {format}")
             
         logger.info(f"Saved preprocessed data to {save_path}")
+    
+    def load_preprocessed(self, load_path: Union[str, Path], 
+                          format: Optional[str] = None) -> pd.DataFrame:
+        """
+        Load data saved by save_preprocessed
+        
+        Args:
+            load_path: Path to saved data
+            format: File format (inferred from the file suffix if not given)
+        """
+        load_path = Path(load_path)
+        if not load_path.exists():
+            raise FileNotFoundError(f"Preprocessed data not found: {load_path}")
+        
+        if format is None:
+            suffix_formats = {'.parquet': 'parquet', '.pkl': 'pickle', '.pickle': 'pickle',
+                              '.csv': 'csv', '.json': 'json'}
+            format = suffix_formats.get(load_path.suffix, 'parquet')
+        
+        pd = _get_pd()
+        if format == 'parquet':
+            df = _read_parquet(load_path)
+        elif format == 'pickle':
+            df = pd.read_pickle(load_path)
+        elif format == 'csv':
+            df = pd.read_csv(load_path)
+        elif format == 'json':
+            df = pd.read_json(load_path, orient='records')
+        else:
+            raise ValueError(f"Unknown format: {format}")
+        
+        self._df = df
+        logger.info(f"Loaded preprocessed data from {load_path}")
+        return df
 
 
     def validate_data(self) -> Dict[str, any]:
@@ -197,13 +390,22 @@ class ArticleDataLoader:
             else:
                 report['missing_coding'] = len(self._df)
         
-        # Validate each article
-        issues = []
-        for idx, row in self._df.iterrows():
-            if pd.isna(row['content']) or len(row['content']) < 50:
-                issues.append(f"Article {row['article_id']}: Content too short or missing")
-            if 'human_coding' not in row or not row['human_coding']:
-                issues.append(f"Article {row['article_id']}: No human coding")
+        # Validate articles with column masks rather than row by row
+        if 'content_length' in self._df.columns:
+            lengths = self._df['content_length']
+        else:
+            lengths = self._df['content'].str.len()
+        bad_content = (lengths.fillna(0) < 50).astype(bool)
+        
+        if 'human_coding' in self._df.columns:
+            bad_coding = self._df['human_coding'].map(lambda coding: not coding).astype(bool)
+        else:
+            bad_coding = _get_pd().Series(True, index=self._df.index)
+        
+        # Build the messages with vectorized string concatenation
+        article_ids = self._df['article_id'].astype(str)
+        issues = ("Article " + article_ids[bad_content] + ": Content too short or missing").tolist()
+        issues += ("Article " + article_ids[bad_coding] + ": No human coding").tolist()
         
         report['issues'] = issues
         report['is_valid'] = len(issues) == 0
@@ -219,23 +421,42 @@ class DataCache:
         self.cache_dir.mkdir(exist_ok=True)
     
     def _get_cache_key(self, data_path: str, preprocessing_version: str = "v1") -> str:
-        """Generate cache key based on file path and version"""
-        key_string = f"{data_path}_{preprocessing_version}"
-        return hashlib.md5(key_string.encode()).hexdigest()
+        """Generate cache key based on file path, modification time, size and version"""
+        # Keying on the file's stat means edits to the data invalidate the cache
+        try:
+            stat = os.stat(data_path)
+            key_string = f"{data_path}_{stat.st_mtime_ns}_{stat.st_size}_{preprocessing_version}"
+        except OSError:
+            key_string = f"{data_path}_{preprocessing_version}"
+        return _hash_key(key_string)
     
-    def _get_cache_path(self, cache_key: str) -> Path:
+    def _get_cache_path(self, cache_key: str, suffix: str = ".pkl") -> Path:
         """Get full path for cache file"""
-        return self.cache_dir / f"{cache_key}.pkl"
+        return self.cache_dir / f"{cache_key}{suffix}"
     
     def load_cached(self, data_path: str, preprocessing_version: str = "v1") -> Optional[any]:
         """Load data from cache if available"""
         cache_key = self._get_cache_key(data_path, preprocessing_version)
-        cache_path = self._get_cache_path(cache_key)
         
-        if cache_path.exists():
+        # DataFrames are cached as Parquet, everything else as pickle
+        for cache_path in (self._get_cache_path(cache_key, ".parquet"),
+                           self._get_cache_path(cache_key)):
+            if not cache_path.exists():
+                continue
             try:
-                with open(cache_path, 'rb') as f:
-                    cached_data = pickle.load(f)
+                if cache_path.suffix == ".parquet":
+                    cached_data = _read_parquet(cache_path)
+                else:
+                    with open(cache_path, 'rb') as f:
+                        compressed = f.read(len(_ZSTD_MAGIC)) == _ZSTD_MAGIC
+                        f.seek(0)
+                        if compressed:
+                            if zstandard is None:
+                                raise RuntimeError("zstandard is required to read compressed cache")
+                            with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                                cached_data = pickle.load(reader)
+                        else:
+                            cached_data = pickle.load(f)
                 logger.info(f"Loaded cached data from {cache_path}")
                 return cached_data
             except Exception as e:
@@ -246,34 +467,57 @@ class DataCache:
     def save_cache(self, data: any, data_path: str, preprocessing_version: str = "v1"):
         """Save data to cache"""
         cache_key = self._get_cache_key(data_path, preprocessing_version)
-        cache_path = self._get_cache_path(cache_key)
+        is_frame = isinstance(data, _get_pd().DataFrame)
+        cache_path = self._get_cache_path(cache_key, ".parquet" if is_frame else ".pkl")
+        stale_path = self._get_cache_path(cache_key, ".pkl" if is_frame else ".parquet")
         
         try:
-            with open(cache_path, 'wb') as f:
-                pickle.dump(data, f)
+            stale_path.unlink(missing_ok=True)
+            if is_frame:
+                _write_parquet(data, cache_path)
+            else:
+                with open(cache_path, 'wb') as f:
+                    if zstandard is not None:
+                        compressor = zstandard.ZstdCompressor(level=3, threads=-1)
+                        with compressor.stream_writer(f) as writer:
+                            pickle.dump(data, writer, protocol=pickle.HIGHEST_PROTOCOL)
+                    else:
+                        pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
             logger.info(f"Saved cache to {cache_path}")
         except Exception as e:
             logger.warning(f"Failed to save cache: {e}")
     
+    def load_or_compute(self, data_path: str, build_fn: Callable[[], Any],
+                        preprocessing_version: str = "v1") -> Any:
+        """
+        Load data from cache, building and caching it on a miss
+        
+        Args:
+            data_path: Path of the source data the cached result depends on
+            build_fn: Zero-argument function that builds the data
+            preprocessing_version: Version tag for the preprocessing logic
+        """
+        data = self.load_cached(data_path, preprocessing_version)
+        if data is None:
+            data = build_fn()
+            self.save_cache(data, data_path, preprocessing_version)
+        return data
+    
     def clear_cache(self):
         """Clear all cached files"""
-        for cache_file in self.cache_dir.glob("*.pkl"):
-            cache_file.unlink()
+        for pattern in ("*.pkl", "*.parquet"):
+            for cache_file in self.cache_dir.glob(pattern):
+                cache_file.unlink()
         logger.info("Cache cleared")
 
 
 def parse_human_coding(coding_data: Dict) -> Dict[str, Dict[str, int]]:
     """Parse human coding data into standardized format"""
-    parsed = {
-        'underrepresentation': {},
-        'overrepresentation': {},
-        'obstacles': {},
-        'successes': {}
-    }
-    
-    for frame_type, demographics in coding_data.items():
-        if frame_type in parsed and isinstance(demographics, dict):
-            parsed[frame_type] = demographics
+    # Look up the four known frames instead of scanning every coded key
+    parsed = {}
+    for frame_type in _FRAME_TYPES:
+        demographics = coding_data.get(frame_type)
+        parsed[frame_type] = demographics if isinstance(demographics, dict) else {}
     
     return parsed
 
@@ -3,14 +3,34 @@ Feature extraction for frame detection
 """
 
 import re
+from bisect import bisect_right
 from typing import List, Dict, Set, Tuple, Optional
 from collections import Counter
 import numpy as np
+from scipy import sparse
 from sklearn.feature_extraction.text import TfidfVectorizer
 import logging
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+try:
+    from .text_utils import is_word_char
+except ImportError:  # imported as a top-level module with src/ on sys.path
+    from text_utils import is_word_char
+
 logger = logging.getLogger(__name__)
 
+# Tokenizer used for batch term counts (keeps single-character tokens)
+_TOKEN_PATTERN = r'\b\w+\b'
+
 
 class FrameFeatureExtractor:
     """Extracts features relevant to frame detection"""
@@ -84,157 +104,426 @@ class FrameFeatureExtractor:
             'statistics': r'\b\d+\.?\d*\s*(?:percent|%|percentage)\b',
             'absolute': r'\b(all|every|none|never|always|only)\b'
         }
-    
-    def extract_lexical_features(self, text: str) -> Dict[str, float]:
-        """Extract frame-specific lexical features"""
-        text_lower = text.lower()
-        features = {}
         
-        # Count frame indicators
+        # Every literal term located by the lexical, demographic and context features
+        self._position_terms = frozenset(self.leadership_terms['positions'])
+        terms = {term
+                 for lexicon in (self.frame_lexicons, self.demographic_terms)
+                 for groups in lexicon.values()
+                 for group_terms in groups.values()
+                 for term in group_terms}
+        terms |= self._position_terms
+        
+        # Frames each term indicates (once per lexicon category it appears in)
+        self._term_frames = {}
         for frame, categories in self.frame_lexicons.items():
-            frame_score = 0
-            for category, terms in categories.items():
-                category_score = 0
-                for term in terms:
-                    count = len(re.findall(r'\b' + re.escape(term) + r'\b', text_lower))
-                    category_score += count
-                    
-                features[f'{frame}_{category}_count'] = category_score
-                # Weight stronger indicators more heavily
-                weight = 2.0 if category == 'strong' else 1.0
-                frame_score += category_score * weight
-                
-            features[f'{frame}_total_score'] = frame_score
+            for category_terms in categories.values():
+                for term in category_terms:
+                    self._term_frames.setdefault(term, []).append(frame)
         
-        # Normalize by text length
-        text_length = len(text.split())
-        for key in list(features.keys()):
-            features[f'{key}_normalized'] = features[key] / text_length if text_length > 0 else 0
+        # Find all terms in one sweep with an Aho-Corasick automaton when
+        # pyahocorasick is installed, otherwise with a single regex alternation
+        self._automaton = None
+        self._terms_re = None
+        self._term_prefixes = {}
+        if ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for term in terms:
+                self._automaton.add_word(term, term)
+            self._automaton.make_automaton()
+        else:
+            # A lookahead reports the longest term at every offset, so terms
+            # starting at different offsets may overlap; shorter terms at the
+            # same offset are exactly its whole-word prefixes
+            ordered = sorted(terms, key=lambda term: (-len(term), term))
+            self._terms_re = re.compile(r'(?=\b(' + '|'.join(map(re.escape, ordered)) + r')\b)')
+            self._term_prefixes = {
+                term: [other for other in ordered
+                       if len(other) < len(term) and term.startswith(other)
+                       and not is_word_char(term[len(other)])]
+                for term in ordered
+            }
         
-        return features
+        # Hyperscan scans ASCII text with SIMD literal prefilters, ahead of
+        # either backend above (its \b and byte offsets are ASCII-only)
+        self._hs_terms = sorted(terms)
+        self._compile_hyperscan()
+        
+        # Lexical score layout: one row per output score and one column per
+        # lexicon category, so every score comes from one matrix-vector product
+        self._category_terms = []
+        self._lexical_names = []
+        weight_rows = []
+        for frame, categories in self.frame_lexicons.items():
+            first = len(self._category_terms)
+            for category, category_terms in categories.items():
+                weight_rows.append({len(self._category_terms): 1.0})
+                self._category_terms.append(category_terms)
+                self._lexical_names.append(f'{frame}_{category}_count')
+            # Weight stronger indicators more heavily
+            weight_rows.append({first + i: 2.0 if category == 'strong' else 1.0
+                                for i, category in enumerate(categories)})
+            self._lexical_names.append(f'{frame}_total_score')
+        
+        self._lexical_weights = np.zeros((len(weight_rows), len(self._category_terms)))
+        for row, weights in enumerate(weight_rows):
+            for col, weight in weights.items():
+                self._lexical_weights[row, col] = weight
+        self._lexical_names += [f'{name}_normalized' for name in self._lexical_names]
+        
+        # Fixed layout of every scalar feature, grouped by extractor; the
+        # extractors write into vectors in this layout
+        feature_groups = {
+            'lexical': self._lexical_names,
+            'demographic': (
+                [f'demo_{category}_{group_name}'
+                 for category, groups in self.demographic_terms.items() for group_name in groups]
+                + ['demo_intersect_black_women', 'demo_intersect_white_men']
+            ),
+            'linguistic': (
+                [f'ling_{pattern_name}_count' for pattern_name in self.linguistic_patterns]
+                + ['ling_avg_sentence_length', 'ling_num_sentences', 'ling_questions',
+                   'ling_exclamations']
+            ),
+            'statistical': ['stats_has_percentages', 'stats_has_numbers', 'stats_has_comparisons',
+                            'stats_min_percentage', 'stats_max_percentage', 'stats_count_numbers'],
+            'context': (['context_leadership_mentions']
+                        + [f'context_{frame}_near_leadership' for frame in self.frame_lexicons]),
+            'text': ['text_length', 'word_count']
+        }
+        self.feature_names = []
+        self._feature_slices = {}
+        for group, names in feature_groups.items():
+            self._feature_slices[group] = slice(len(self.feature_names),
+                                                len(self.feature_names) + len(names))
+            self.feature_names += names
+        self.feature_index = {name: i for i, name in enumerate(self.feature_names)}
+        
+        # Features reported as floats in feature dicts; the rest are counts/flags
+        self._float_features = frozenset(self._lexical_names) | {
+            'ling_avg_sentence_length', 'stats_min_percentage', 'stats_max_percentage'
+        }
+        
+        # Vector slots for each demographic group and its terms
+        self._demographic_slots = [
+            (self.feature_index[f'demo_{category}_{group_name}'], group_terms)
+            for category, groups in self.demographic_terms.items()
+            for group_name, group_terms in groups.items()
+        ]
+        self._frame_slots = {frame: self.feature_index[f'context_{frame}_near_leadership']
+                             for frame in self.frame_lexicons}
+        
+        # Batch vocabulary over lexicon and leadership terms, written the way the
+        # tokenizer sees them (e.g. 'african-american' -> 'african american')
+        token_re = re.compile(_TOKEN_PATTERN)
+        vocab_terms = {' '.join(token_re.findall(term)) for term in terms}
+        self._lex_vocab = {term: i for i, term in enumerate(sorted(vocab_terms))}
+        
+        # Vocabulary columns in each lexicon category, so batch lexical scores
+        # come straight from the term count matrix
+        self._vocab_categories = np.zeros((len(self._lex_vocab), len(self._category_terms)),
+                                          dtype=np.float32)
+        for col, category_terms in enumerate(self._category_terms):
+            for term in category_terms:
+                self._vocab_categories[self._lex_vocab[' '.join(token_re.findall(term))], col] = 1
+        
+        # Compile every pattern once instead of on each call
+        # (matched against lowercased text, so no case folding is needed)
+        self._linguistic_res = {
+            pattern_name: re.compile(pattern)
+            for pattern_name, pattern in self.linguistic_patterns.items()
+        }
+        self._sentence_end_re = re.compile(r'[.!?]+(?:\s|$)')
+        self._percent_re = re.compile(r'(\d+(?:\.\d+)?)\s*(?:percent|%)')
+        self._number_re = re.compile(r'\b\d+\b')
+        self._comparison_re = re.compile(r'(\d+(?:\.\d+)?)\s*times\s*(more|less|higher|lower)')
     
-    def extract_demographic_features(self, text: str) -> Dict[str, int]:
-        """Extract demographic mention features"""
-        text_lower = text.lower()
-        features = {}
-        
-        for category, groups in self.demographic_terms.items():
-            for group_name, terms in groups.items():
-                count = 0
-                for term in terms:
-                    # Use word boundaries for accurate matching
-                    pattern = r'\b' + re.escape(term) + r'\b'
-                    count += len(re.findall(pattern, text_lower))
-                
-                features[f'demo_{category}_{group_name}'] = count
+    def _compile_hyperscan(self):
+        """Compile the Hyperscan term database, if Hyperscan is installed"""
+        self._hs_db = None
+        self._hs_scratch = None
+        if hyperscan is None:
+            return
         
-        # Add co-occurrence features
-        if features.get('demo_gender_women', 0) > 0 and features.get('demo_race_black', 0) > 0:
-            features['demo_intersect_black_women'] = 1
-        if features.get('demo_gender_men', 0) > 0 and features.get('demo_race_white', 0) > 0:
-            features['demo_intersect_white_men'] = 1
+        try:
+            self._hs_db = hyperscan.Database()
+            self._hs_db.compile(
+                expressions=[rb'\b' + re.escape(term).encode() + rb'\b' for term in self._hs_terms],
+                ids=list(range(len(self._hs_terms))),
+                elements=len(self._hs_terms),
+                flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(self._hs_terms)
+            )
+            self._hs_scratch = hyperscan.Scratch(self._hs_db)
+        except hyperscan.error as e:
+            logger.warning(f"Hyperscan unavailable, using fallback term scan: {e}")
+            self._hs_db = None
+    
+    def __getstate__(self):
+        # Hyperscan databases cannot be pickled; they are recompiled on load
+        state = self.__dict__.copy()
+        state['_hs_db'] = None
+        state['_hs_scratch'] = None
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._compile_hyperscan()
+    
+    def _find_terms(self, text_lower: str) -> List[Tuple[int, int, str]]:
+        """Find whole-word occurrences of every known term as (start, end, term)"""
+        hits = []
+        
+        if self._hs_db is not None and text_lower.isascii():
+            # Byte offsets equal character offsets for ASCII text
+            terms = self._hs_terms
             
+            def on_match(term_id, start, end, flags, context):
+                hits.append((start, end, terms[term_id]))
+            
+            self._hs_db.scan(text_lower.encode('ascii'), match_event_handler=on_match,
+                             scratch=self._hs_scratch)
+        elif self._automaton is not None:
+            text_end = len(text_lower) - 1
+            for end, term in self._automaton.iter(text_lower):
+                # Apply the same word boundaries as the regex patterns
+                start = end - len(term) + 1
+                if start > 0 and is_word_char(text_lower[start - 1]):
+                    continue
+                if end < text_end and is_word_char(text_lower[end + 1]):
+                    continue
+                hits.append((start, end + 1, term))
+        else:
+            for match in self._terms_re.finditer(text_lower):
+                start = match.start()
+                term = match.group(1)
+                hits.append((start, start + len(term), term))
+                hits.extend((start, start + len(prefix), prefix) for prefix in self._term_prefixes[term])
+        
+        return hits
+    
+    def _count_terms(self, text_lower: str) -> Counter:
+        """Count whole-word occurrences of every known term in lowercased text"""
+        return Counter(term for _, _, term in self._find_terms(text_lower))
+    
+    def _to_features(self, vec: np.ndarray, group: Optional[str] = None,
+                     percentages: Optional[np.ndarray] = None) -> Dict[str, any]:
+        """Convert a feature vector (or one group of it) to a feature dict"""
+        span = self._feature_slices[group] if group else slice(None)
+        features = {name: value if name in self._float_features else int(value)
+                    for name, value in zip(self.feature_names[span], vec[span].tolist())}
+        
+        # Conditional features only appear when they apply
+        if features.get('demo_intersect_black_women') == 0:
+            del features['demo_intersect_black_women']
+        if features.get('demo_intersect_white_men') == 0:
+            del features['demo_intersect_white_men']
+        if 'stats_has_percentages' in features:
+            features['stats_percentage_values'] = np.empty(0) if percentages is None else percentages
+            if not features['stats_has_percentages']:
+                del features['stats_min_percentage'], features['stats_max_percentage']
+        if features.get('context_leadership_mentions') == 0:
+            for frame in self.frame_lexicons:
+                del features[f'context_{frame}_near_leadership']
+        
         return features
     
-    def extract_linguistic_features(self, text: str) -> Dict[str, float]:
-        """Extract linguistic pattern features"""
-        features = {}
+    def _write_lexical(self, out: np.ndarray, term_counts: Counter, num_words: int):
+        """Write frame lexicon counts and scores into a feature vector"""
+        # Count frame indicators per category, then weight them into scores
+        category_counts = np.fromiter(
+            (sum(term_counts[term] for term in terms) for terms in self._category_terms),
+            dtype=np.float64, count=len(self._category_terms)
+        )
+        scores = self._lexical_weights @ category_counts
         
-        for pattern_name, pattern in self.linguistic_patterns.items():
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            features[f'ling_{pattern_name}_count'] = len(matches)
+        # Normalize by text length
+        span = self._feature_slices['lexical']
+        out[span] = np.concatenate([scores, scores / num_words if num_words > 0 else 0 * scores])
+    
+    def _write_demographic(self, out: np.ndarray, term_counts: Counter):
+        """Write demographic mention counts into a feature vector"""
+        for i, terms in self._demographic_slots:
+            # Terms are counted on word boundaries for accurate matching
+            out[i] = sum(term_counts[term] for term in terms)
         
-        # Sentence-level features
-        sentences = text.split('.')
-        features['ling_avg_sentence_length'] = np.mean([len(s.split()) for s in sentences if s.strip()])
-        features['ling_num_sentences'] = len(sentences)
+        # Add co-occurrence features
+        index = self.feature_index
+        if out[index['demo_gender_women']] > 0 and out[index['demo_race_black']] > 0:
+            out[index['demo_intersect_black_women']] = 1
+        if out[index['demo_gender_men']] > 0 and out[index['demo_race_white']] > 0:
+            out[index['demo_intersect_white_men']] = 1
+    
+    def _write_linguistic(self, out: np.ndarray, text: str, text_lower: str, num_words: int):
+        """Write linguistic pattern features into a feature vector"""
+        index = self.feature_index
         
-        # Question marks and exclamations (emotional language)
-        features['ling_questions'] = text.count('?')
-        features['ling_exclamations'] = text.count('!')
+        # Count matches without materialising match lists
+        for pattern_name, pattern in self._linguistic_res.items():
+            out[index[f'ling_{pattern_name}_count']] = sum(1 for _ in pattern.finditer(text_lower))
         
-        return features
+        # Sentence-level features (count boundaries rather than splitting)
+        num_sentences = 0
+        last_end = 0
+        for match in self._sentence_end_re.finditer(text):
+            num_sentences += 1
+            last_end = match.end()
+        if text[last_end:].strip():
+            # Trailing sentence without closing punctuation
+            num_sentences += 1
+        out[index['ling_avg_sentence_length']] = num_words / num_sentences if num_sentences else 0.0
+        out[index['ling_num_sentences']] = num_sentences
+        
+        # Question marks and exclamations (emotional language)
+        out[index['ling_questions']] = text.count('?')
+        out[index['ling_exclamations']] = text.count('!')
     
-    def extract_statistical_features(self, text: str) -> Dict[str, any]:
-        """Extract features related to statistics and numbers"""
-        features = {
-            'stats_has_percentages': 0,
-            'stats_has_numbers': 0,
-            'stats_has_comparisons': 0,
-            'stats_percentage_values': []
-        }
+    def _write_statistical(self, out: np.ndarray, text_lower: str) -> np.ndarray:
+        """Write statistics features into a feature vector, returning the percentages"""
+        index = self.feature_index
         
         # Find percentages
-        percent_pattern = r'(\d+(?:\.\d+)?)\s*(?:percent|%)'
-        percentages = re.findall(percent_pattern, text, re.IGNORECASE)
+        percentages = self._percent_re.findall(text_lower)
+        values = np.fromiter(percentages, dtype=np.float64, count=len(percentages))
         if percentages:
-            features['stats_has_percentages'] = 1
-            features['stats_percentage_values'] = [float(p) for p in percentages]
-            features['stats_min_percentage'] = min(features['stats_percentage_values'])
-            features['stats_max_percentage'] = max(features['stats_percentage_values'])
+            out[index['stats_has_percentages']] = 1
+            out[index['stats_min_percentage']] = values.min()
+            out[index['stats_max_percentage']] = values.max()
         
         # Find raw numbers
-        number_pattern = r'\b\d+\b'
-        numbers = re.findall(number_pattern, text)
-        features['stats_has_numbers'] = 1 if numbers else 0
-        features['stats_count_numbers'] = len(numbers)
+        num_numbers = sum(1 for _ in self._number_re.finditer(text_lower))
+        out[index['stats_has_numbers']] = 1 if num_numbers else 0
+        out[index['stats_count_numbers']] = num_numbers
         
-        # Find comparisons
-        comparison_pattern = r'(\d+(?:\.\d+)?)\s*times\s*(more|less|higher|lower)'
-        comparisons = re.findall(comparison_pattern, text, re.IGNORECASE)
-        features['stats_has_comparisons'] = 1 if comparisons else 0
+        # Find comparisons (only presence matters, so stop at the first)
+        out[index['stats_has_comparisons']] = 1 if self._comparison_re.search(text_lower) else 0
         
-        return features
+        return values
     
-    def extract_context_features(self, text: str, window_size: int = 50) -> Dict[str, any]:
-        """Extract features based on context windows around key terms"""
-        features = {}
+    def _write_context(self, out: np.ndarray, term_hits: List[Tuple[int, int, str]],
+                       window_size: int):
+        """Write leadership context features into a feature vector"""
+        # Find leadership mentions and merge their context windows
+        windows = []
+        for start, end in sorted((start, end) for start, end, term in term_hits
+                                 if term in self._position_terms):
+            start = max(0, start - window_size)
+            end += window_size
+            if windows and start <= windows[-1][1]:
+                windows[-1][1] = max(windows[-1][1], end)
+            else:
+                windows.append([start, end])
+        
+        out[self.feature_index['context_leadership_mentions']] = sum(
+            1 for _, _, term in term_hits if term in self._position_terms
+        )
+        
+        # Count frame indicators that fall inside a leadership context window
+        if windows:
+            window_starts = [start for start, _ in windows]
+            for start, end, term in term_hits:
+                frames = self._term_frames.get(term)
+                if not frames:
+                    continue
+                i = bisect_right(window_starts, start) - 1
+                if i >= 0 and end <= windows[i][1]:
+                    for frame in frames:
+                        out[self._frame_slots[frame]] += 1
+    
+    def _write_features(self, text: str, out: np.ndarray, lexical: bool = True) -> np.ndarray:
+        """Write every feature for a text into a zeroed vector, returning the percentages"""
+        # Lowercase, split and find terms once for all extractors
         text_lower = text.lower()
+        num_words = len(text.split())
+        term_hits = self._find_terms(text_lower)
+        term_counts = Counter(term for _, _, term in term_hits)
         
-        # Find leadership mentions and their contexts
-        leadership_contexts = []
-        for term in self.leadership_terms['positions']:
-            for match in re.finditer(r'\b' + term + r'\b', text_lower):
-                start = max(0, match.start() - window_size)
-                end = min(len(text), match.end() + window_size)
-                context = text[start:end]
-                leadership_contexts.append(context)
-        
-        features['context_leadership_mentions'] = len(leadership_contexts)
-        
-        # Analyze contexts for frame indicators
-        if leadership_contexts:
-            context_text = ' '.join(leadership_contexts)
-            # Check for frame indicators in leadership contexts
-            for frame in self.frame_lexicons:
-                frame_count = 0
-                for category_terms in self.frame_lexicons[frame].values():
-                    for term in category_terms:
-                        if term in context_text.lower():
-                            frame_count += 1
-                features[f'context_{frame}_near_leadership'] = frame_count
+        if lexical:
+            self._write_lexical(out, term_counts, num_words)
+        self._write_demographic(out, term_counts)
+        self._write_linguistic(out, text, text_lower, num_words)
+        percentages = self._write_statistical(out, text_lower)
+        self._write_context(out, term_hits, window_size=50)
         
-        return features
+        # Add text length as a feature
+        out[self.feature_index['text_length']] = len(text)
+        out[self.feature_index['word_count']] = num_words
+        
+        return percentages
+    
+    def _new_vector(self) -> np.ndarray:
+        """Zeroed float64 feature vector"""
+        return np.zeros(len(self.feature_names))
+    
+    def extract_lexical_features(self, text: str, text_lower: Optional[str] = None,
+                                 words: Optional[List[str]] = None,
+                                 term_counts: Optional[Counter] = None) -> Dict[str, float]:
+        """Extract frame-specific lexical features"""
+        if term_counts is None:
+            term_counts = self._count_terms(text.lower() if text_lower is None else text_lower)
+        out = self._new_vector()
+        self._write_lexical(out, term_counts, len(text.split() if words is None else words))
+        return self._to_features(out, 'lexical')
+    
+    def extract_demographic_features(self, text: str, text_lower: Optional[str] = None,
+                                     term_counts: Optional[Counter] = None) -> Dict[str, int]:
+        """Extract demographic mention features"""
+        if term_counts is None:
+            term_counts = self._count_terms(text.lower() if text_lower is None else text_lower)
+        out = self._new_vector()
+        self._write_demographic(out, term_counts)
+        return self._to_features(out, 'demographic')
+    
+    def extract_linguistic_features(self, text: str, text_lower: Optional[str] = None,
+                                    words: Optional[List[str]] = None) -> Dict[str, float]:
+        """Extract linguistic pattern features"""
+        out = self._new_vector()
+        self._write_linguistic(out, text, text.lower() if text_lower is None else text_lower,
+                               len(text.split() if words is None else words))
+        return self._to_features(out, 'linguistic')
+    
+    def extract_statistical_features(self, text: str,
+                                     text_lower: Optional[str] = None) -> Dict[str, any]:
+        """Extract features related to statistics and numbers"""
+        out = self._new_vector()
+        percentages = self._write_statistical(out, text.lower() if text_lower is None else text_lower)
+        return self._to_features(out, 'statistical', percentages)
+    
+    def extract_context_features(self, text: str, window_size: int = 50,
+                                 text_lower: Optional[str] = None,
+                                 term_hits: Optional[List[Tuple[int, int, str]]] = None) -> Dict[str, any]:
+        """Extract features based on context windows around key terms"""
+        if term_hits is None:
+            term_hits = self._find_terms(text.lower() if text_lower is None else text_lower)
+        out = self._new_vector()
+        self._write_context(out, term_hits, window_size)
+        return self._to_features(out, 'context')
     
     def extract_all_features(self, text: str) -> Dict[str, any]:
         """Extract all features for frame detection"""
-        features = {}
+        out = self._new_vector()
+        percentages = self._write_features(text, out)
+        return self._to_features(out, percentages=percentages)
+    
+    def extract_all_features_vec(self, text: str, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Extract all features as a dense vector laid out by feature_index
         
-        # Combine all feature types
-        features.update(self.extract_lexical_features(text))
-        features.update(self.extract_demographic_features(text))
-        features.update(self.extract_linguistic_features(text))
-        features.update(self.extract_statistical_features(text))
-        features.update(self.extract_context_features(text))
+        Features that do not apply to the text (e.g. no percentages) are 0.
         
-        # Add text length as a feature
-        features['text_length'] = len(text)
-        features['word_count'] = len(text.split())
+        Args:
+            text: Text to extract features from
+            out: Optional float32 array of length len(feature_names) to fill
+        """
+        if out is None:
+            out = np.zeros(len(self.feature_names), dtype=np.float32)
+        else:
+            out[:] = 0
         
-        return features
+        self._write_features(text, out)
+        return out
     
     def extract_features_for_training(self, segments: List[Dict[str, str]], 
-                                    labels: Optional[List[List[str]]] = None) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+                                    labels: Optional[List[List[str]]] = None) -> Tuple[sparse.csr_matrix, Optional[np.ndarray]]:
         """
         Extract features from text segments for model training
         
@@ -243,19 +532,30 @@ class FrameFeatureExtractor:
             labels: Optional list of frame labels for each segment
             
         Returns:
-            Feature matrix and optional label matrix
+            Sparse feature matrix (term counts, then feature_names) and
+            optional label matrix
         """
-        feature_dicts = []
+        from sklearn.feature_extraction.text import CountVectorizer
+        
+        texts = [segment.get('text', segment.get('content', '')) for segment in segments]
+        
+        # Count every lexicon term across all segments in one vectorized pass
+        term_vectorizer = CountVectorizer(vocabulary=self._lex_vocab, token_pattern=_TOKEN_PATTERN,
+                                          ngram_range=(1, 3), dtype=np.float32)
+        term_counts = term_vectorizer.transform(texts)
+        
+        # Lexical scores for every segment from the term counts
+        scores = (term_counts @ self._vocab_categories) @ self._lexical_weights.T.astype(np.float32)
+        num_words = np.array([len(text.split()) for text in texts], dtype=np.float32)[:, None]
+        normalized = np.divide(scores, num_words, out=np.zeros_like(scores), where=num_words > 0)
         
-        for segment in segments:
-            text = segment.get('text', segment.get('content', ''))
-            features = self.extract_all_features(text)
-            feature_dicts.append(features)
+        # The remaining features need term positions, so fill them per segment
+        features = np.zeros((len(texts), len(self.feature_names)), dtype=np.float32)
+        features[:, self._feature_slices['lexical']] = np.hstack([scores, normalized])
+        for row, text in enumerate(texts):
+            self._write_features(text, features[row], lexical=False)
         
-        # Convert to matrix
-        from sklearn.feature_extraction import DictVectorizer
-        vectorizer = DictVectorizer()
-        X = vectorizer.fit_transform(feature_dicts)
+        X = sparse.hstack([term_counts, sparse.csr_matrix(features)], format='csr')
         
         # Process labels if provided
         y = None
@@ -3,10 +3,9 @@ Frame detection models and base classes
 """
 
 from abc import ABC, abstractmethod
+from collections import Counter
 from typing import List, Dict, Tuple, Optional, Union
 import numpy as np
-from transformers import pipeline, AutoTokenizer, AutoModelForSequenceClassification
-import torch
 import logging
 
 logger = logging.getLogger(__name__)
@@ -37,6 +36,10 @@ class ZeroShotFrameDetector(BaseFrameDetector):
             model_name: HuggingFace model for zero-shot classification
             device: Device to run on (0 for GPU, -1 for CPU, None for auto)
         """
+        # Deferred so the rule-based analysis works without torch installed
+        import torch
+        from transformers import pipeline
+        
         if device is None:
             device = 0 if torch.cuda.is_available() else -1
             
@@ -55,6 +58,29 @@ class ZeroShotFrameDetector(BaseFrameDetector):
         }
         
         self.threshold = 0.5  # Confidence threshold
+        
+        # Candidate labels and their reverse mapping, built once
+        self._candidate_labels = list(self.frame_labels.values())
+        self._label_to_frame = {v: k for k, v in self.frame_labels.items()}
+    
+    def _classify(self, texts: List[str]) -> List[Dict[str, float]]:
+        """Classify all texts in a single pipeline call and map labels back to frame names"""
+        if not texts:
+            return []
+        
+        outputs = self.classifier(
+            texts,
+            candidate_labels=self._candidate_labels,
+            multi_label=True
+        )
+        if isinstance(outputs, dict):
+            outputs = [outputs]
+        
+        return [
+            {self._label_to_frame[label]: score
+             for label, score in zip(output['labels'], output['scores'])}
+            for output in outputs
+        ]
     
     def predict(self, text: Union[str, List[str]]) -> Union[Dict, List[Dict]]:
         """Predict frames using zero-shot classification"""
@@ -62,28 +88,12 @@ class ZeroShotFrameDetector(BaseFrameDetector):
         texts = [text] if single_input else text
         
         results = []
-        for t in texts:
-            # Run classification
-            output = self.classifier(
-                t,
-                candidate_labels=list(self.frame_labels.values()),
-                multi_label=True
-            )
-            
+        for scores in self._classify(texts):
             # Extract predictions above threshold
             predictions = {
-                'frames': [],
-                'scores': {}
+                'frames': [frame for frame, score in scores.items() if score >= self.threshold],
+                'scores': scores
             }
-            
-            for label, score in zip(output['labels'], output['scores']):
-                # Map back to frame name
-                frame_name = [k for k, v in self.frame_labels.items() if v == label][0]
-                predictions['scores'][frame_name] = score
-                
-                if score >= self.threshold:
-                    predictions['frames'].append(frame_name)
-            
             results.append(predictions)
         
         return results[0] if single_input else results
@@ -93,21 +103,7 @@ class ZeroShotFrameDetector(BaseFrameDetector):
         single_input = isinstance(text, str)
         texts = [text] if single_input else text
         
-        results = []
-        for t in texts:
-            output = self.classifier(
-                t,
-                candidate_labels=list(self.frame_labels.values()),
-                multi_label=True
-            )
-            
-            # Create probability dict
-            proba = {}
-            for label, score in zip(output['labels'], output['scores']):
-                frame_name = [k for k, v in self.frame_labels.items() if v == label][0]
-                proba[frame_name] = score
-            
-            results.append(proba)
+        results = self._classify(texts)
         
         return results[0] if single_input else results
     
@@ -119,40 +115,68 @@ class ZeroShotFrameDetector(BaseFrameDetector):
 class TransformerFrameDetector(BaseFrameDetector):
     """Fine-tuned transformer model for frame detection"""
     
-    def __init__(self, model_path: str, device: Optional[str] = None):
+    def __init__(self, model_path: str, device: Optional[str] = None, batch_size: int = 32,
+                 compile_model: bool = False):
         """
         Initialize with fine-tuned model
         
         Args:
             model_path: Path to fine-tuned model or HuggingFace model ID
             device: Device to run on
+            batch_size: Number of texts per forward pass
+            compile_model: Compile the model with torch.compile (PyTorch 2.x)
         """
+        import torch
+        from transformers import AutoTokenizer, AutoModelForSequenceClassification
+        
         if device is None:
             device = 'cuda' if torch.cuda.is_available() else 'cpu'
         
         self.device = device
+        self.batch_size = batch_size
         self.tokenizer = AutoTokenizer.from_pretrained(model_path)
         self.model = AutoModelForSequenceClassification.from_pretrained(model_path)
         self.model.to(device)
         self.model.eval()
         
+        if compile_model:
+            self._compile_model()
+        
         # Frame labels (order matters for model output)
         self.frame_labels = ['underrepresentation', 'overrepresentation', 
                            'obstacles', 'successes']
         self.threshold = 0.5
     
+    def _compile_model(self):
+        """Wrap the model with torch.compile, keeping eager mode if unavailable"""
+        import torch
+        
+        if not hasattr(torch, 'compile'):
+            logger.warning("torch.compile requires PyTorch 2.x, using eager mode")
+            return
+        
+        # CUDA graphs cut per-batch launch overhead; padded batch shapes vary
+        # between calls, so mark them dynamic to avoid recompiling per shape
+        mode = 'reduce-overhead' if str(self.device).startswith('cuda') else 'default'
+        try:
+            self.model = torch.compile(self.model, mode=mode, dynamic=True)
+        except Exception as e:
+            logger.warning(f"torch.compile failed, using eager mode: {e}")
+    
     def predict(self, text: Union[str, List[str]]) -> Union[Dict, List[Dict]]:
         """Predict frames using fine-tuned model"""
+        import torch
+        
         single_input = isinstance(text, str)
         texts = [text] if single_input else text
         
         results = []
         
-        with torch.no_grad():
-            for t in texts:
-                # Tokenize
+        with torch.inference_mode():
+            # Tokenize and run the model a batch of texts at a time
+            for start in range(0, len(texts), self.batch_size):
                 inputs = self.tokenizer(
-                    t,
+                    texts[start:start + self.batch_size],
                     padding=True,
                     truncation=True,
                     max_length=512,
@@ -161,22 +185,23 @@ class TransformerFrameDetector(BaseFrameDetector):
                 
                 # Get predictions
                 outputs = self.model(**inputs)
-                probs = torch.sigmoid(outputs.logits).cpu().numpy()[0]
+                batch_probs = torch.sigmoid(outputs.logits).cpu().numpy()
                 
                 # Extract predictions
-                predictions = {
-                    'frames': [],
-                    'scores': {}
-                }
-                
-                for i, frame in enumerate(self.frame_labels):
-                    score = float(probs[i])
-                    predictions['scores'][frame] = score
+                for probs in batch_probs:
+                    predictions = {
+                        'frames': [],
+                        'scores': {}
+                    }
                     
-                    if score >= self.threshold:
-                        predictions['frames'].append(frame)
-                
-                results.append(predictions)
+                    for i, frame in enumerate(self.frame_labels):
+                        score = float(probs[i])
+                        predictions['scores'][frame] = score
+                        
+                        if score >= self.threshold:
+                            predictions['frames'].append(frame)
+                    
+                    results.append(predictions)
         
         return results[0] if single_input else results
     
@@ -214,6 +239,8 @@ class EnsembleFrameDetector(BaseFrameDetector):
             
         self.weights = weights
         self.threshold = 0.5
+        
+        self._weights = np.asarray(weights, dtype=np.float64)
     
     def predict(self, text: Union[str, List[str]]) -> Union[Dict, List[Dict]]:
         """Ensemble prediction"""
@@ -244,44 +271,27 @@ class EnsembleFrameDetector(BaseFrameDetector):
         single_input = isinstance(text, str)
         
         # Get predictions from all detectors
-        all_predictions = []
-        for detector in self.detectors:
-            preds = detector.predict_proba(text)
-            all_predictions.append(preds)
-        
-        # Aggregate predictions
+        all_predictions = [detector.predict_proba(text) for detector in self.detectors]
         if single_input:
-            # Single text input
-            aggregated = {}
-            frames = all_predictions[0].keys()
-            
-            for frame in frames:
-                weighted_score = sum(
-                    pred.get(frame, 0) * weight 
-                    for pred, weight in zip(all_predictions, self.weights)
-                )
-                aggregated[frame] = weighted_score
-            
-            return aggregated
-        else:
-            # Multiple texts
-            results = []
-            num_texts = len(all_predictions[0])
-            
-            for i in range(num_texts):
-                aggregated = {}
-                frames = all_predictions[0][i].keys()
-                
-                for frame in frames:
-                    weighted_score = sum(
-                        pred[i].get(frame, 0) * weight 
-                        for pred, weight in zip(all_predictions, self.weights)
-                    )
-                    aggregated[frame] = weighted_score
-                
-                results.append(aggregated)
-            
-            return results
+            all_predictions = [[preds] for preds in all_predictions]
+        
+        # Stack into a (detectors, texts, frames) array over every frame any
+        # detector scored (missing scores count as 0), then take the weighted sum
+        frames = list(dict.fromkeys(frame for preds in all_predictions
+                                    for pred in preds for frame in pred))
+        scores = np.array([
+            [[pred.get(frame, 0.0) for frame in frames] for pred in preds]
+            for preds in all_predictions
+        ], dtype=np.float64).reshape(len(all_predictions), len(all_predictions[0]), len(frames))
+        aggregated = np.tensordot(self._weights, scores, axes=1)
+        
+        # Report the frames the first detector scored for each text
+        results = []
+        for first_pred, row in zip(all_predictions[0], aggregated.tolist()):
+            row_scores = dict(zip(frames, row))
+            results.append({frame: row_scores[frame] for frame in first_pred})
+        
+        return results[0] if single_input else results
     
     def set_threshold(self, threshold: float):
         """Set confidence threshold for predictions"""
@@ -325,7 +335,8 @@ class FrameAnalyzer:
         
         # Segment if available
         if self.segmenter:
-            segments = self.segmenter.segment_for_analysis(article)
+            # A preprocessed article lets the segmenter reuse its sentences
+            segments = self.segmenter.segment_for_analysis(processed if self.preprocessor else article)
             analysis_units = segments['windows']
         else:
             analysis_units = [{'text': text}]
@@ -372,34 +383,36 @@ class FrameAnalyzer:
     
     def _aggregate_results(self, results: List[Dict]) -> Dict:
         """Aggregate frame results across segments"""
-        all_frames = []
-        all_demographics = []
-        frame_scores = {'underrepresentation': [], 'overrepresentation': [], 
-                       'obstacles': [], 'successes': []}
+        frames = ['underrepresentation', 'overrepresentation', 'obstacles', 'successes']
         
+        # Count frames and demographics in bulk
+        frame_counts = Counter()
+        demo_counts = Counter()
         for result in results:
-            all_frames.extend(result['frames'])
-            all_demographics.extend(result.get('demographics', []))
-            
-            for frame, score in result['scores'].items():
-                frame_scores[frame].append(score)
-        
-        # Count frames
-        from collections import Counter
-        frame_counts = Counter(all_frames)
-        demo_counts = Counter(all_demographics)
-        
-        # Average scores
-        avg_scores = {}
-        for frame, scores in frame_scores.items():
-            avg_scores[frame] = np.mean(scores) if scores else 0.0
+            frame_counts.update(result['frames'])
+            # Demographics may be a list of groups or the preprocessor's
+            # group -> matches dict; either way count each group once
+            demo_counts.update(list(result.get('demographics', ())))
+        
+        # Segment scores as a (segments, frames) matrix; NaN marks a missing score
+        scores = np.full((len(results), len(frames)), np.nan)
+        for i, result in enumerate(results):
+            for j, frame in enumerate(frames):
+                scores[i, j] = result['scores'].get(frame, np.nan)
+        
+        # Average scores over the segments that scored each frame
+        present = ~np.isnan(scores)
+        totals = np.where(present, scores, 0.0).sum(axis=0)
+        num_scored = present.sum(axis=0)
+        averages = np.divide(totals, num_scored, out=np.zeros(len(frames)), where=num_scored > 0)
+        avg_scores = dict(zip(frames, averages.tolist()))
         
         return {
-            'frames': list(set(all_frames)),
+            'frames': list(frame_counts),
             'scores': avg_scores,
-            'demographics': list(set(all_demographics)),
+            'demographics': list(demo_counts),
             'counts': {
                 'frames': dict(frame_counts),
                 'demographics': dict(demo_counts)
             }
-        }
\ No newline at end of file
+        }
@@ -2,13 +2,25 @@
 Text preprocessing utilities for article analysis
 """
 
+import os
 import re
 import string
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Dict, Tuple, Optional
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
+from nltk.tokenize import word_tokenize
 import logging
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from .text_utils import PARA_RE, is_word_char, tokenize_sentences
+except ImportError:  # imported as a top-level module with src/ on sys.path
+    from text_utils import PARA_RE, is_word_char, tokenize_sentences
+
 logger = logging.getLogger(__name__)
 
 # Download required NLTK data
@@ -19,6 +31,16 @@ except LookupError:
     nltk.download('punkt', quiet=True)
 
 
+# Paragraphs remembered per preprocessor by create_training_examples
+_PARAGRAPH_CACHE_SIZE = 4096
+
+# Curly quotes normalized to their ASCII equivalents in a single pass
+_QUOTE_TRANS = str.maketrans({
+    '\u201c': '"', '\u201d': '"',
+    '\u2018': "'", '\u2019': "'",
+})
+
+
 class ArticlePreprocessor:
     """Preprocesses news articles for frame detection"""
     
@@ -62,56 +84,180 @@ class ArticlePreprocessor:
                 'accomplished', 'pioneering', 'historic', 'landmark'
             ]
         }
+        
+        # Plurals of the noun indicators, which also count as indicators
+        self.indicator_plurals = {
+            'minority': 'minorities', 'small percentage': 'small percentages',
+            'majority': 'majorities',
+            'barrier': 'barriers', 'ceiling': 'ceilings', 'difficulty': 'difficulties',
+            'struggle': 'struggles', 'bias': 'biases', 'prejudice': 'prejudices',
+            'breakthrough': 'breakthroughs', 'achievement': 'achievements',
+            'milestone': 'milestones', 'landmark': 'landmarks'
+        }
+        
+        # Compile patterns once; methods below run them per article
+        self._url_re = re.compile(r'http[s]?://\S+')
+        # The demographic term lists are disjoint, so one alternation with a
+        # named group per demographic finds the same matches in one scan
+        self._demographics_re = re.compile('|'.join(
+            f'(?P<{demo}>{pattern})' for demo, pattern in self.demographic_patterns.items()
+        ))
+        self._leadership_res = [
+            re.compile(r'\b' + term + r'\b') for term in self.leadership_terms
+        ]
+        
+        # Aho-Corasick finds every leadership term in a single pass
+        self._leadership_automaton = None
+        if ahocorasick is not None:
+            self._leadership_automaton = ahocorasick.Automaton()
+            for idx, term in enumerate(self.leadership_terms):
+                self._leadership_automaton.add_word(term, (idx, len(term)))
+            self._leadership_automaton.make_automaton()
+        self._percent_re = re.compile(r'(\d+(?:\.\d+)?)\s*(?:percent|%)', re.IGNORECASE)
+        self._comparison_re = re.compile(
+            r'(\d+(?:\.\d+)?)\s*times\s*(more|less|higher|lower)', re.IGNORECASE
+        )
+        frame_terms = {
+            frame: indicators + [self.indicator_plurals[term]
+                                 for term in indicators if term in self.indicator_plurals]
+            for frame, indicators in self.frame_indicators.items()
+        }
+        # One scan finds every frame indicator; the lookahead keeps
+        # overlapping hits
+        frame_groups = '|'.join(
+            f'(?P<{frame}>' + '|'.join(map(re.escape, terms)) + ')'
+            for frame, terms in frame_terms.items()
+        )
+        self._frames_re = re.compile(r'(?=\b(?:' + frame_groups + r')\b)')
+        
+        # Aho-Corasick equivalent
+        self._frames_automaton = None
+        if ahocorasick is not None:
+            self._frames_automaton = ahocorasick.Automaton()
+            for frame, terms in frame_terms.items():
+                for term in terms:
+                    self._frames_automaton.add_word(term, (frame, len(term)))
+            self._frames_automaton.make_automaton()
+        
+        # Paragraph checks for training examples, which repeat across
+        # re-runs; keyed on the short lowercased paragraphs only
+        self._paragraph_cache = {}
+    
+    def __getstate__(self):
+        # Workers and unpickled copies start with an empty paragraph cache
+        state = self.__dict__.copy()
+        state['_paragraph_cache'] = {}
+        return state
     
     def clean_text(self, text: str) -> str:
         """Basic text cleaning"""
         # Remove URLs
-        text = re.sub(r'http[s]?://\S+', '', text)
-        
-        # Remove extra whitespace
-        text = ' '.join(text.split())
+        text = self._url_re.sub('', text)
         
         # Fix common encoding issues
-        text = text.replace('"', '"').replace('"', '"')
-        text = text.replace(''', "'").replace(''', "'")
+        text = text.translate(_QUOTE_TRANS)
         
-        return text.strip()
+        # Remove extra whitespace (also strips the ends)
+        return ' '.join(text.split())
     
     def extract_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
-        sentences = sent_tokenize(text)
-        return [s.strip() for s in sentences if len(s.strip()) > 10]
+        # Cached on the text; copy so callers can mutate the result
+        return list(tokenize_sentences(text))
     
     def extract_paragraphs(self, text: str) -> List[str]:
         """Split text into paragraphs"""
-        # Split by double newlines or common paragraph patterns
-        paragraphs = re.split(r'\n\s*\n|\r\n\s*\r\n', text)
-        return [p.strip() for p in paragraphs if len(p.strip()) > 20]
+        # Split by double newlines (covers Windows line endings too)
+        paragraphs = (p.strip() for p in PARA_RE.split(text))
+        return [p for p in paragraphs if len(p) > 20]
+    
+    def analyze_text(self, text: str) -> Dict:
+        """Run the leadership, demographic, statistic and frame scans, lowercasing once"""
+        text_lower = text.lower()
+        return {
+            'leadership_contexts': self._leadership_contexts(text, text_lower),
+            'demographics_found': self._demographics(text_lower),
+            'statistics': self.extract_statistics(text),
+            'frame_candidates': self._frame_candidates(text_lower)
+        }
     
     def find_leadership_context(self, text: str) -> List[Tuple[int, int, str]]:
         """Find mentions of leadership positions"""
-        text_lower = text.lower()
+        return self._leadership_contexts(text, text.lower())
+    
+    def _leadership_contexts(self, text: str, text_lower: str) -> List[Tuple[int, int, str]]:
+        """Leadership contexts from the original text, matched on its lowercased form"""
         contexts = []
         
-        for term in self.leadership_terms:
-            pattern = r'\b' + term + r'\b'
-            for match in re.finditer(pattern, text_lower):
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end]
-                contexts.append((start, end, context))
+        for match_start, match_end in self._find_leadership_spans(text_lower):
+            start = max(0, match_start - 100)
+            end = min(len(text), match_end + 100)
+            context = text[start:end]
+            contexts.append((start, end, context))
         
         return contexts
     
+    def _find_leadership_spans(self, text_lower: str) -> List[Tuple[int, int]]:
+        """Whole-word leadership term spans, grouped by term in list order"""
+        if self._leadership_automaton is None:
+            return [match.span()
+                    for term_re in self._leadership_res
+                    for match in term_re.finditer(text_lower)]
+        
+        hits = []
+        text_end = len(text_lower) - 1
+        for end, (idx, length) in self._leadership_automaton.iter(text_lower):
+            start = end - length + 1
+            # Apply the same word boundaries as the regex patterns
+            if start > 0 and is_word_char(text_lower[start - 1]):
+                continue
+            if end < text_end and is_word_char(text_lower[end + 1]):
+                continue
+            hits.append((idx, start, end + 1))
+        
+        hits.sort()
+        return [(start, end) for _, start, end in hits]
+    
+    def _has_leadership_term(self, text_lower: str) -> bool:
+        """Check whether any leadership term occurs as a substring"""
+        if self._leadership_automaton is None:
+            return any(term in text_lower for term in self.leadership_terms)
+        return next(self._leadership_automaton.iter(text_lower), None) is not None
+    
     def detect_demographics(self, text: str) -> Dict[str, List[str]]:
         """Detect demographic mentions in text"""
-        text_lower = text.lower()
-        found = {}
+        return self._demographics(text.lower())
+    
+    def _demographics(self, text_lower: str) -> Dict[str, List[str]]:
+        """Demographic mentions in lowercased text"""
+        return {demo: list(matches)
+                for demo, matches in self._match_demographics(text_lower)}
+    
+    def _paragraph_demographics(self, para_lower: str) -> Optional[Tuple[str, ...]]:
+        """Demographic groups in a paragraph with a leadership term, else None"""
+        try:
+            return self._paragraph_cache[para_lower]
+        except KeyError:
+            pass
         
-        for demo, pattern in self.demographic_patterns.items():
-            matches = re.findall(pattern, text_lower)
-            if matches:
-                found[demo] = matches
+        groups = None
+        if self._has_leadership_term(para_lower):
+            groups = tuple(demo for demo, _ in self._match_demographics(para_lower))
+        
+        # Bounded by starting over rather than tracking recency
+        if len(self._paragraph_cache) >= _PARAGRAPH_CACHE_SIZE:
+            self._paragraph_cache.clear()
+        self._paragraph_cache[para_lower] = groups
+        return groups
+    
+    def _match_demographics(self, text_lower: str) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+        """Demographic matches for lowercased text as hashable (demo, matches) pairs"""
+        matches = {}
+        for match in self._demographics_re.finditer(text_lower):
+            matches.setdefault(match.lastgroup, []).append(match.group())
+        
+        # Report demographics in pattern order
+        found = {demo: matches[demo] for demo in self.demographic_patterns if demo in matches}
         
         # Detect intersectional identities
         if 'women' in found and ('black' in found or 'hispanic' in found or 
@@ -128,15 +274,14 @@ class ArticlePreprocessor:
                                'asian' in found or 'poc' in found):
             found['men_of_color'] = ['men of color']
         
-        return found
+        return tuple((demo, tuple(matches)) for demo, matches in found.items())
     
     def extract_statistics(self, text: str) -> List[Dict[str, str]]:
         """Extract statistical mentions (percentages, numbers)"""
         stats = []
         
         # Find percentages
-        percent_pattern = r'(\d+(?:\.\d+)?)\s*(?:percent|%)'
-        for match in re.finditer(percent_pattern, text, re.IGNORECASE):
+        for match in self._percent_re.finditer(text):
             context_start = max(0, match.start() - 50)
             context_end = min(len(text), match.end() + 50)
             stats.append({
@@ -146,8 +291,7 @@ class ArticlePreprocessor:
             })
         
         # Find comparisons (X times more/less)
-        comparison_pattern = r'(\d+(?:\.\d+)?)\s*times\s*(more|less|higher|lower)'
-        for match in re.finditer(comparison_pattern, text, re.IGNORECASE):
+        for match in self._comparison_re.finditer(text):
             context_start = max(0, match.start() - 50)
             context_end = min(len(text), match.end() + 50)
             stats.append({
@@ -161,22 +305,42 @@ class ArticlePreprocessor:
     
     def identify_frame_candidates(self, text: str) -> Dict[str, List[str]]:
         """Find potential frame indicators in text"""
-        text_lower = text.lower()
-        candidates = {}
-        
-        for frame, indicators in self.frame_indicators.items():
-            found = []
-            for indicator in indicators:
-                if indicator in text_lower:
-                    # Find context around indicator
-                    pattern = r'.{0,50}\b' + re.escape(indicator) + r'\b.{0,50}'
-                    matches = re.findall(pattern, text_lower, re.IGNORECASE)
-                    found.extend(matches)
-            
-            if found:
-                candidates[frame] = found
+        return self._frame_candidates(text.lower())
+    
+    def _frame_candidates(self, text_lower: str) -> Dict[str, List[str]]:
+        """Frame indicator contexts in lowercased text"""
+        found = {}
+        
+        for start, end, frame in self._find_frame_spans(text_lower):
+            # Up to 50 characters of context either side, within the line
+            context_start = max(start - 50, text_lower.rfind('\n', max(0, start - 50), start) + 1)
+            context_end = text_lower.find('\n', end, end + 50)
+            if context_end == -1:
+                context_end = end + 50
+            found.setdefault(frame, []).append(text_lower[context_start:context_end])
+        
+        # Report frames in definition order
+        return {frame: found[frame] for frame in self.frame_indicators if frame in found}
+    
+    def _find_frame_spans(self, text_lower: str) -> List[Tuple[int, int, str]]:
+        """Whole-word frame indicator hits as (start, end, frame), in text order"""
+        if self._frames_automaton is None:
+            return [match.span(match.lastgroup) + (match.lastgroup,)
+                    for match in self._frames_re.finditer(text_lower)]
         
-        return candidates
+        hits = []
+        text_end = len(text_lower) - 1
+        for end, (frame, length) in self._frames_automaton.iter(text_lower):
+            start = end - length + 1
+            # Apply the same word boundaries as the regex pattern
+            if start > 0 and is_word_char(text_lower[start - 1]):
+                continue
+            if end < text_end and is_word_char(text_lower[end + 1]):
+                continue
+            hits.append((start, end + 1, frame))
+        
+        hits.sort()
+        return hits
     
     def preprocess_article(self, article: Dict) -> Dict:
         """Full preprocessing pipeline for an article"""
@@ -190,10 +354,7 @@ class ArticlePreprocessor:
         paragraphs = self.extract_paragraphs(cleaned)
         
         # Find relevant contexts
-        leadership_contexts = self.find_leadership_context(cleaned)
-        demographics = self.detect_demographics(cleaned)
-        statistics = self.extract_statistics(cleaned)
-        frame_candidates = self.identify_frame_candidates(cleaned)
+        analysis = self.analyze_text(cleaned)
         
         # Create preprocessed article
         preprocessed = {
@@ -205,10 +366,10 @@ class ArticlePreprocessor:
             'cleaned_content': cleaned,
             'sentences': sentences,
             'paragraphs': paragraphs,
-            'leadership_contexts': leadership_contexts,
-            'demographics_found': demographics,
-            'statistics': statistics,
-            'frame_candidates': frame_candidates,
+            'leadership_contexts': analysis['leadership_contexts'],
+            'demographics_found': analysis['demographics_found'],
+            'statistics': analysis['statistics'],
+            'frame_candidates': analysis['frame_candidates'],
             'word_count': len(cleaned.split()),
             'sentence_count': len(sentences)
         }
@@ -225,18 +386,15 @@ class ArticlePreprocessor:
         
         # For each paragraph that contains leadership terms
         for para in article['paragraphs']:
-            para_lower = para.lower()
-            
-            # Check if paragraph is relevant (contains leadership terms)
-            if any(term in para_lower for term in self.leadership_terms):
-                # Detect demographics in this paragraph
-                demos = self.detect_demographics(para)
-                
+            # Demographics of the paragraph if it is relevant (contains
+            # leadership terms), else None
+            demos = self._paragraph_demographics(para.lower())
+            if demos is not None:
                 # Create example
                 example = {
                     'text': para,
                     'article_id': article['article_id'],
-                    'demographics': list(demos.keys()) if demos else [],
+                    'demographics': list(demos),
                 }
                 
                 # Add labels from human coding if available
@@ -249,4 +407,39 @@ class ArticlePreprocessor:
                 
                 examples.append(example)
         
-        return examples
\ No newline at end of file
+        return examples
+    
+    def preprocess_batch(self, articles: List[Dict], n_workers: Optional[int] = None) -> List[Dict]:
+        """
+        Preprocess articles across worker processes
+        
+        Args:
+            articles: Articles to preprocess
+            n_workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Preprocessed articles in input order
+        """
+        n_workers = n_workers or os.cpu_count() or 1
+        if n_workers == 1 or len(articles) < 2:
+            return [self.preprocess_article(article) for article in articles]
+        
+        # Each worker receives this preprocessor once, not with every chunk
+        chunksize = max(1, len(articles) // (4 * n_workers))
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker,
+                                 initargs=(self,)) as executor:
+            return list(executor.map(_preprocess_in_worker, articles, chunksize=chunksize))
+
+
+_worker_preprocessor = None
+
+
+def _init_worker(preprocessor: ArticlePreprocessor):
+    """Set the preprocessor used by a batch worker process"""
+    global _worker_preprocessor
+    _worker_preprocessor = preprocessor
+
+
+def _preprocess_in_worker(article: Dict) -> Dict:
+    """Preprocess one article inside a batch worker process"""
+    return _worker_preprocessor.preprocess_article(article)
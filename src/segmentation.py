@@ -3,13 +3,32 @@ Text segmentation utilities for article analysis
 """
 
 import re
+from bisect import bisect_left
 from typing import List, Tuple, Dict, Optional
-import nltk
-from nltk.tokenize import sent_tokenize
 import logging
 
+try:
+    from .text_utils import PARA_RE, tokenize_sentences
+except ImportError:  # imported as a top-level module with src/ on sys.path
+    from text_utils import PARA_RE, tokenize_sentences
+
 logger = logging.getLogger(__name__)
 
+_PERIOD_RE = re.compile(r'\.')
+
+
+# Quotes with or without attribution, matched in a single pass (stdlib re,
+# whose \s also covers NBSP and other Unicode spaces)
+_QUOTE_RE = re.compile(
+    # "Quote," said Person
+    r'"(?P<quote>[^"]+)"\s*,?\s*(?:said|says|according to)\s+(?P<attribution>[^,.]+)'
+    # Person said, "Quote"
+    r'|(?P<speaker>[^,]+?)\s+(?:said|says|stated)\s*,?\s*"(?P<speaker_quote>[^"]+)"'
+    # Simple quotes
+    r'|"(?P<bare_quote>[^"]{20,})"',  # At least 20 chars to avoid short phrases
+    re.IGNORECASE
+)
+
 
 class ArticleSegmenter:
     """Segments articles into analyzable chunks"""
@@ -24,86 +43,63 @@ class ArticleSegmenter:
         """
         self.window_size = window_size
         self.overlap = overlap
-        
-        # Ensure NLTK data is available
-        try:
-            nltk.data.find('tokenizers/punkt')
-        except LookupError:
-            nltk.download('punkt', quiet=True)
     
     def segment_by_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
-        sentences = sent_tokenize(text)
-        # Filter out very short sentences
-        return [s.strip() for s in sentences if len(s.strip()) > 10]
+        # Cached on the text; copy so callers can mutate the result
+        return list(tokenize_sentences(text))
     
     def segment_by_paragraphs(self, text: str) -> List[str]:
         """Split text into paragraphs"""
-        # Multiple newline patterns
-        paragraph_patterns = [
-            r'\n\s*\n',  # Double newline
-            r'\r\n\s*\r\n',  # Windows style
-            r'\n{2,}',  # Multiple newlines
-        ]
-        
-        # Try each pattern
-        paragraphs = [text]
-        for pattern in paragraph_patterns:
-            new_paragraphs = []
-            for para in paragraphs:
-                splits = re.split(pattern, para)
-                new_paragraphs.extend(splits)
-            paragraphs = new_paragraphs
-        
-        # Clean and filter
-        cleaned = []
-        for p in paragraphs:
-            p = p.strip()
-            if len(p) > 20:  # Minimum paragraph length
-                cleaned.append(p)
-        
-        return cleaned
+        # Double newlines, Windows style and longer newline runs in one pass
+        paragraphs = (p.strip() for p in PARA_RE.split(text))
+        # Minimum paragraph length
+        return [p for p in paragraphs if len(p) > 20]
     
     def create_sliding_windows(self, sentences: List[str]) -> List[Dict[str, any]]:
         """
         Create overlapping windows of sentences
         
         Returns:
-            List of windows with metadata
+            List of windows with metadata; char_start/char_end locate each
+            window's text in ' '.join(sentences)
         """
-        if len(sentences) <= self.window_size:
-            return [{
-                'text': ' '.join(sentences),
-                'sentences': sentences,
-                'start_idx': 0,
-                'end_idx': len(sentences) - 1,
-                'window_id': 0
-            }]
-        
-        windows = []
-        step = self.window_size - self.overlap
-        
-        for i in range(0, len(sentences) - self.window_size + 1, step):
-            window_sentences = sentences[i:i + self.window_size]
-            windows.append({
-                'text': ' '.join(window_sentences),
-                'sentences': window_sentences,
-                'start_idx': i,
-                'end_idx': i + self.window_size - 1,
-                'window_id': len(windows)
-            })
+        # Join once; each window's text is a slice of the joined sentences
+        joined = ' '.join(sentences)
+        offsets = [0]
+        for sentence in sentences:
+            offsets.append(offsets[-1] + len(sentence) + 1)
+        
+        def make_window(start: int, end: int, window_id: int) -> Dict[str, any]:
+            char_start, char_end = offsets[start], max(offsets[end + 1] - 1, 0)
+            return {
+                'text': joined[char_start:char_end],
+                'sentences': sentences[start:end + 1],
+                'start_idx': start,
+                'end_idx': end,
+                'char_start': char_start,
+                'char_end': char_end,
+                'window_id': window_id
+            }
         
-        # Add final window if needed
-        if windows and windows[-1]['end_idx'] < len(sentences) - 1:
-            remaining = sentences[windows[-1]['end_idx'] + 1 - self.overlap:]
-            if remaining:
-                windows.append({
-                    'text': ' '.join(remaining),
-                    'sentences': remaining,
-                    'start_idx': windows[-1]['end_idx'] + 1 - self.overlap,
-                    'end_idx': len(sentences) - 1,
-                    'window_id': len(windows)
-                })
+        n = len(sentences)
+        window_size = self.window_size
+        overlap = self.overlap
+        
+        if n <= window_size:
+            return [make_window(0, n - 1, 0)]
+        
+        starts = range(0, n - window_size + 1, window_size - overlap)
+        windows = [
+            make_window(start, start + window_size - 1, window_id)
+            for window_id, start in enumerate(starts)
+        ]
+        
+        # Add final window if the regular windows stop short of the last sentence
+        if starts:
+            tail_start = starts[-1] + window_size - overlap
+            if starts[-1] + window_size < n and tail_start < n:
+                windows.append(make_window(tail_start, n - 1, len(windows)))
         
         return windows
     
@@ -123,6 +119,9 @@ class ArticleSegmenter:
         segments = []
         text_lower = text.lower()
         
+        # Sentence ends, searched by bisection for each keyword hit
+        periods = [match.start() for match in _PERIOD_RE.finditer(text)]
+        
         for keyword in keywords:
             keyword_lower = keyword.lower()
             # Find all occurrences
@@ -132,14 +131,14 @@ class ArticleSegmenter:
                 
                 # Extend to sentence boundaries
                 # Find previous sentence end
-                prev_period = text.rfind('.', start, match.start())
-                if prev_period != -1:
-                    start = prev_period + 1
+                prev_idx = bisect_left(periods, match.start()) - 1
+                if prev_idx >= 0 and periods[prev_idx] >= start:
+                    start = periods[prev_idx] + 1
                 
                 # Find next sentence end
-                next_period = text.find('.', match.end(), end)
-                if next_period != -1:
-                    end = next_period + 1
+                next_idx = bisect_left(periods, match.end())
+                if next_idx < len(periods) and periods[next_idx] < end:
+                    end = periods[next_idx] + 1
                 
                 segment = text[start:end].strip()
                 
@@ -157,36 +156,23 @@ class ArticleSegmenter:
         """Extract quoted text from articles"""
         quotes = []
         
-        # Pattern for quotes with attribution
-        quote_patterns = [
-            # "Quote," said Person
-            r'"([^"]+)"\s*,?\s*(?:said|says|according to)\s+([^,.]+)',
-            # Person said, "Quote"
-            r'([^,]+?)\s+(?:said|says|stated)\s*,?\s*"([^"]+)"',
-            # Simple quotes
-            r'"([^"]{20,})"'  # At least 20 chars to avoid short phrases
-        ]
-        
-        for pattern in quote_patterns:
-            for match in re.finditer(pattern, text, re.IGNORECASE):
-                if len(match.groups()) == 2:
-                    # Quote with attribution
-                    if 'said' in pattern:
-                        quote_text = match.group(1)
-                        attribution = match.group(2)
-                    else:
-                        attribution = match.group(1)
-                        quote_text = match.group(2)
-                else:
-                    # Just the quote
-                    quote_text = match.group(1)
-                    attribution = None
-                
-                quotes.append({
-                    'text': quote_text.strip(),
-                    'attribution': attribution.strip() if attribution else None,
-                    'full_match': match.group(0)
-                })
+        for match in _QUOTE_RE.finditer(text):
+            if match.group('quote') is not None:
+                quote_text = match.group('quote')
+                attribution = match.group('attribution')
+            elif match.group('speaker') is not None:
+                quote_text = match.group('speaker_quote')
+                attribution = match.group('speaker')
+            else:
+                # Just the quote
+                quote_text = match.group('bare_quote')
+                attribution = None
+            
+            quotes.append({
+                'text': quote_text.strip(),
+                'attribution': attribution.strip() if attribution else None,
+                'full_match': match.group(0)
+            })
         
         return quotes
     
@@ -195,16 +181,25 @@ class ArticleSegmenter:
         Comprehensive segmentation for frame analysis
         
         Args:
-            article: Article dict with 'content' field
+            article: Article dict with 'content' field, or a preprocessed
+                article from ArticlePreprocessor
             
         Returns:
             Dict with different segmentation types
         """
-        text = article.get('cleaned_content', article['content'])
-        
-        # Get sentences and paragraphs
-        sentences = self.segment_by_sentences(text)
-        paragraphs = self.segment_by_paragraphs(text)
+        if 'cleaned_content' in article:
+            text = article['cleaned_content']
+        else:
+            text = article['content']
+        
+        # Get sentences and paragraphs, reusing those of a preprocessed article
+        # (ArticlePreprocessor splits its cleaned_content the same way)
+        if 'cleaned_content' in article and 'sentences' in article and 'paragraphs' in article:
+            sentences = article['sentences']
+            paragraphs = article['paragraphs']
+        else:
+            sentences = self.segment_by_sentences(text)
+            paragraphs = self.segment_by_paragraphs(text)
         
         # Create sliding windows
         windows = self.create_sliding_windows(sentences)
@@ -0,0 +1,42 @@
+"""
+Text helpers shared by the preprocessing, segmentation and feature modules
+"""
+
+import re
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=None)
+def _load_punkt():
+    """Load the English Punkt model on first use, once per process"""
+    # Imported here so modules needing only the regex helpers skip NLTK
+    import nltk
+    try:
+        from nltk.tokenize import PunktTokenizer
+    except ImportError:  # NLTK < 3.8.2 ships pickled models
+        resource, load = 'punkt', lambda: nltk.data.load('tokenizers/punkt/english.pickle')
+    else:
+        resource, load = 'punkt_tab', lambda: PunktTokenizer('english')
+
+    try:
+        return load()
+    except LookupError:
+        nltk.download(resource, quiet=True)
+        return load()
+
+
+# Paragraph breaks: any newline pair with only whitespace between them
+PARA_RE = re.compile(r'\n\s*\n')
+
+
+@lru_cache(maxsize=2048)
+def tokenize_sentences(text: str) -> Tuple[str, ...]:
+    """Split text into stripped sentences longer than 10 characters"""
+    stripped = (s.strip() for s in _load_punkt().tokenize(text))
+    return tuple(s for s in stripped if len(s) > 10)
+
+
+def is_word_char(char: str) -> bool:
+    """Match the regex definition of a word character"""
+    return char.isalnum() or char == '_'
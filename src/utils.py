@@ -2,15 +2,24 @@
 Common utilities for the spam news analysis project
 """
 
+import copy
 import logging
 import json
+import math
 import yaml
+from datetime import date, datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 import pandas as pd
 import numpy as np
-from datetime import datetime
 import hashlib
+import time
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None):
@@ -34,6 +43,10 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None):
     )
 
 
+# libyaml's C loader when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
 def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
     """Load configuration from YAML file"""
     config_path = Path(config_path)
@@ -41,13 +54,43 @@ def load_config(config_path: Union[str, Path]) -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"Config file not found: {config_path}")
     
-    with open(config_path, 'r') as f:
-        if config_path.suffix in ['.yaml', '.yml']:
-            return yaml.safe_load(f)
-        elif config_path.suffix == '.json':
+    # Parsed once per file version; copied so callers can modify their config
+    config = _parse_config(str(config_path.resolve()), config_path.stat().st_mtime_ns)
+    return copy.deepcopy(config)
+
+
+@lru_cache(maxsize=32)
+def _parse_config(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file; the mtime in the cache key drops stale entries"""
+    suffix = Path(path).suffix
+    
+    with open(path, 'r') as f:
+        if suffix in ['.yaml', '.yml']:
+            return yaml.load(f, Loader=_YAML_LOADER)
+        elif suffix == '.json':
             return json.load(f)
         else:
-            raise ValueError(f"Unsupported config format: {config_path.suffix}")
+            raise ValueError(f"Unsupported config format: {suffix}")
+
+
+def _replace_nan(obj: Any) -> Any:
+    """Replace NaN and infinite floats with None, as orjson writes them"""
+    if isinstance(obj, float):
+        return obj if math.isfinite(obj) else None
+    if isinstance(obj, dict):
+        return {key: _replace_nan(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_replace_nan(value) for value in obj]
+    return obj
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize values JSON has no type for (NumPy values, dates, ...)"""
+    if isinstance(obj, (datetime, date)):  # pd.Timestamp included
+        return obj.isoformat()
+    if isinstance(obj, (np.ndarray, np.generic)):
+        return _replace_nan(obj.tolist())
+    return str(obj)
 
 
 def save_results(results: Dict[str, Any], output_path: Union[str, Path], 
@@ -64,8 +107,17 @@ def save_results(results: Dict[str, Any], output_path: Union[str, Path],
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
     if format == 'json':
-        with open(output_path, 'w') as f:
-            json.dump(results, f, indent=2, default=str)
+        # Both writers produce the same JSON: NumPy values as numbers and
+        # lists, dates in ISO format, NaN as null, anything else through str
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(
+                results,
+                default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
+        else:
+            with open(output_path, 'w') as f:
+                json.dump(_replace_nan(results), f, indent=2, default=_json_default)
     elif format == 'csv':
         df = pd.DataFrame(results)
         df.to_csv(output_path, index=False)
@@ -90,26 +142,21 @@ def calculate_icc(ratings1: np.ndarray, ratings2: np.ndarray) -> float:
     if n != len(ratings2):
         raise ValueError("Rating arrays must have same length")
     
-    # Create data frame for ICC calculation
-    data = pd.DataFrame({
-        'target': list(range(n)) * 2,
-        'rater': [0] * n + [1] * n,
-        'rating': list(ratings1) + list(ratings2)
-    })
+    # One row per target, one column per rater
+    ratings = np.column_stack([
+        np.asarray(ratings1, dtype=np.float64),
+        np.asarray(ratings2, dtype=np.float64)
+    ])
     
     # Calculate mean squares
-    grand_mean = data['rating'].mean()
+    grand_mean = ratings.mean()
     
     # Between-target variance
-    target_means = data.groupby('target')['rating'].mean()
-    ms_between = n * 2 * ((target_means - grand_mean) ** 2).mean()
+    target_means = ratings.mean(axis=1)
+    ms_between = 2 * ((target_means - grand_mean) ** 2).sum()
     
     # Within-target variance
-    ms_within = 0
-    for target in range(n):
-        target_ratings = data[data['target'] == target]['rating']
-        ms_within += ((target_ratings - target_ratings.mean()) ** 2).sum()
-    ms_within = ms_within / (n * (2 - 1))
+    ms_within = ((ratings - target_means[:, None]) ** 2).sum() / (n * (2 - 1))
     
     # Calculate ICC(2,1)
     icc = (ms_between - ms_within) / (ms_between + ms_within)
@@ -133,20 +180,17 @@ def calculate_agreement_metrics(predictions: List[Dict], ground_truth: List[Dict
     # Frame types
     frame_types = ['underrepresentation', 'overrepresentation', 'obstacles', 'successes']
     
-    # Convert to binary arrays
-    y_true = []
-    y_pred = []
+    # Binary encoding for each frame
+    n = min(len(predictions), len(ground_truth))
+    y_true = np.zeros((n, len(frame_types)), dtype=np.int8)
+    y_pred = np.zeros((n, len(frame_types)), dtype=np.int8)
     
-    for pred, truth in zip(predictions, ground_truth):
-        # Binary encoding for each frame
-        true_binary = [1 if frame in truth.get('frames', []) else 0 for frame in frame_types]
-        pred_binary = [1 if frame in pred.get('frames', []) else 0 for frame in frame_types]
+    for row, (pred, truth) in enumerate(zip(predictions, ground_truth)):
+        true_frames = set(truth.get('frames', ()))
+        pred_frames = set(pred.get('frames', ()))
         
-        y_true.append(true_binary)
-        y_pred.append(pred_binary)
-    
-    y_true = np.array(y_true)
-    y_pred = np.array(y_pred)
+        y_true[row] = [frame in true_frames for frame in frame_types]
+        y_pred[row] = [frame in pred_frames for frame in frame_types]
     
     # Calculate metrics for each frame
     metrics = {}
@@ -211,28 +255,26 @@ def create_frame_summary(coding_data: pd.DataFrame) -> pd.DataFrame:
     Returns:
         Summary DataFrame
     """
-    summary = []
-    
     frame_types = ['underrepresentation', 'overrepresentation', 'obstacles', 'successes']
     demographic_groups = ['women', 'men', 'white_women', 'white_men', 
                          'women_of_color', 'men_of_color']
     
-    for frame in frame_types:
-        for demo in demographic_groups:
-            # Count occurrences
-            mask = (coding_data['frame_type'] == frame) & \
-                   (coding_data['demographic_group'] == demo)
-            count = coding_data[mask]['count'].sum()
-            
-            if count > 0:
-                summary.append({
-                    'frame': frame,
-                    'demographic': demo,
-                    'total_count': count,
-                    'num_articles': coding_data[mask]['article_id'].nunique()
-                })
+    # Group once; unknown frames/demographics fall out as NaN keys and the
+    # categories keep the reporting order
+    keys = [
+        pd.Categorical(coding_data['frame_type'], categories=frame_types),
+        pd.Categorical(coding_data['demographic_group'], categories=demographic_groups)
+    ]
+    grouped = coding_data.groupby(keys, observed=True).agg(
+        total_count=('count', 'sum'),
+        num_articles=('article_id', 'nunique')
+    )
+    grouped.index.names = ['frame', 'demographic']
+    
+    summary = grouped[grouped['total_count'] > 0].reset_index()
+    summary[['frame', 'demographic']] = summary[['frame', 'demographic']].astype(object)
     
-    return pd.DataFrame(summary)
+    return summary
 
 
 def format_results_for_thesis(results: Dict[str, Any]) -> str:
@@ -290,7 +332,8 @@ def get_device():
 
 def hash_text(text: str) -> str:
     """Generate hash for text (useful for caching)"""
-    return hashlib.md5(text.encode()).hexdigest()
+    # Not cryptographic; always blake2b so keys match across installs
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
 
 
 def batch_iterator(items: List[Any], batch_size: int):
@@ -316,9 +359,9 @@ class Timer:
         self.logger = logging.getLogger(__name__)
     
     def __enter__(self):
-        self.start = datetime.now()
+        self.start = time.perf_counter_ns()
         return self
     
     def __exit__(self, *args):
-        duration = (datetime.now() - self.start).total_seconds()
+        duration = (time.perf_counter_ns() - self.start) / 1e9
         self.logger.info(f"{self.name} took {duration:.2f} seconds")
\ No newline at end of file
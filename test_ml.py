@@ -6,130 +6,81 @@ Test ML components
 import sys
 from pathlib import Path
 
+import pytest
+
+PROJECT_ROOT = Path(__file__).parent
+
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent / 'src'))
+sys.path.insert(0, str(PROJECT_ROOT / 'src'))
+
+
+@pytest.fixture(autouse=True)
+def project_dir(monkeypatch):
+    """Run each test from the project directory"""
+    monkeypatch.chdir(PROJECT_ROOT)
 
+
+# Hub downloads fail without network access; that is not a model regression
+@pytest.mark.xfail(raises=OSError, strict=False, reason="model download unavailable")
 def test_frame_detection():
     """Test frame detection with real models"""
-    print("🧪 Testing Zero-Shot Frame Detection")
-    
-    try:
-        from frame_detection import ZeroShotFrameDetector
-        
-        # Create detector
-        detector = ZeroShotFrameDetector()
-        
-        # Test text
-        text = "Women hold only 21% of leadership positions, facing significant barriers to advancement."
-        
-        # Get predictions
-        result = detector.predict(text)
-        
-        print(f"  ✅ Frames detected: {result['frames']}")
-        print(f"  ✅ Scores: {result['scores']}")
-        
-        # Check expected results
-        expected_frames = ['underrepresentation', 'obstacles']
-        found_expected = any(frame in result['frames'] for frame in expected_frames)
-        
-        if found_expected:
-            print("  ✅ Model correctly identified expected frames")
-            return True
-        else:
-            print("  ⚠️  Model didn't find expected frames, but it's working")
-            return True
-            
-    except Exception as e:
-        print(f"  ❌ Frame detection test failed: {e}")
-        return False
+    pytest.importorskip('torch')
+    pytest.importorskip('transformers')
+    from frame_detection import ZeroShotFrameDetector
+
+    # Create detector
+    detector = ZeroShotFrameDetector()
+
+    # Test text
+    text = "Women hold only 21% of leadership positions, facing significant barriers to advancement."
+
+    # Get predictions; the model may not find the expected frames, but
+    # it must score every frame
+    result = detector.predict(text)
+
+    assert set(result['scores']) == {'underrepresentation', 'overrepresentation',
+                                     'obstacles', 'successes'}
+    assert set(result['frames']) <= set(result['scores'])
 
 def test_data_loading():
     """Test data loading with pandas"""
-    print("\n🧪 Testing Data Loading with Pandas")
-    
-    try:
-        from data_loader import ArticleDataLoader
-        
-        loader = ArticleDataLoader()
-        df = loader.load_articles()
-        
-        print(f"  ✅ Loaded {len(df)} articles")
-        
-        # Test validation
-        report = loader.validate_data()
-        print(f"  ✅ Validation complete: {report['total_articles']} articles")
-        
-        # Test coding extraction
-        coding_df = loader.get_coding_data()
-        print(f"  ✅ Extracted {len(coding_df)} coding annotations")
-        
-        return True
-        
-    except Exception as e:
-        print(f"  ❌ Data loading test failed: {e}")
-        return False
+    from data_loader import ArticleDataLoader
+
+    loader = ArticleDataLoader()
+    df = loader.load_articles(streaming=True)
+    assert len(df) > 0
+
+    # Test validation
+    report = loader.validate_data()
+    assert report['total_articles'] == len(df)
+
+    # Test coding extraction
+    coding_df = loader.get_coding_data()
+    assert len(coding_df) > 0
 
 def test_preprocessing():
     """Test preprocessing with NLTK"""
-    print("\n🧪 Testing Preprocessing with NLTK")
-    
-    try:
-        from preprocessing import ArticlePreprocessor
-        
-        preprocessor = ArticlePreprocessor()
-        
-        sample_article = {
-            'article_id': 'test_001',
-            'source': 'Test',
-            'date': '2021-01-01',
-            'title': 'Test Article',
-            'content': 'Women hold only 21% of C-suite positions. Black women face concrete barriers to advancement.',
-            'human_coding': {
-                'underrepresentation': {'women': 1},
-                'obstacles': {'women_of_color': 1}
-            }
+    from preprocessing import ArticlePreprocessor
+
+    preprocessor = ArticlePreprocessor()
+
+    sample_article = {
+        'article_id': 'test_001',
+        'source': 'Test',
+        'date': '2021-01-01',
+        'title': 'Test Article',
+        'content': 'Women hold only 21% of C-suite positions. Black women face concrete barriers to advancement.',
+        'human_coding': {
+            'underrepresentation': {'women': 1},
+            'obstacles': {'women_of_color': 1}
         }
-        
-        processed = preprocessor.preprocess_article(sample_article)
-        
-        print(f"  ✅ Processed article: {len(processed['sentences'])} sentences")
-        print(f"  ✅ Demographics found: {list(processed['demographics_found'].keys())}")
-        print(f"  ✅ Frame candidates: {list(processed['frame_candidates'].keys())}")
-        
-        return True
-        
-    except Exception as e:
-        print(f"  ❌ Preprocessing test failed: {e}")
-        return False
+    }
+
+    processed = preprocessor.preprocess_article(sample_article)
+
+    assert len(processed['sentences']) == 2
+    assert list(processed['demographics_found']) == ['women', 'black', 'women_of_color']
+    assert list(processed['frame_candidates']) == ['underrepresentation', 'obstacles']
 
 if __name__ == "__main__":
-    print("🚀 Running ML Component Tests\n")
-    
-    tests = [
-        ("Data Loading", test_data_loading),
-        ("Preprocessing", test_preprocessing),
-        ("Frame Detection", test_frame_detection),
-    ]
-    
-    results = []
-    for test_name, test_func in tests:
-        success = test_func()
-        results.append((test_name, success))
-    
-    print("\n" + "="*50)
-    print("📊 ML TEST SUMMARY")
-    print("="*50)
-    
-    passed = sum(1 for _, success in results if success)
-    total = len(results)
-    
-    for test_name, success in results:
-        status = "✅ PASS" if success else "❌ FAIL"
-        print(f"{status} {test_name}")
-    
-    print(f"\nResults: {passed}/{total} ML tests passed")
-    
-    if passed == total:
-        print("🎉 All ML components are working!")
-    else:
-        print("⚠️  Some ML tests failed.")
\ No newline at end of file
+    sys.exit(pytest.main([__file__, '-v']))
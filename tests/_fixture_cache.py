@@ -0,0 +1,34 @@
+"""
+Cached loaders for shared test fixtures
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+SAMPLE_ARTICLES_PATH = Path(__file__).parent.parent / 'data' / 'sample_articles.json'
+
+
+def load_articles_cached(path: Union[str, Path] = SAMPLE_ARTICLES_PATH) -> List[Dict]:
+    """
+    Load a JSON articles fixture, reparsing only after the file changes
+    
+    The result is shared between callers and must be treated as read-only.
+    """
+    path = Path(path).resolve()
+    return _load_json(str(path), path.stat().st_mtime_ns)
+
+
+@lru_cache(maxsize=None)
+def _load_json(path: str, mtime_ns: int) -> List[Dict]:
+    """Parse a JSON file; the mtime in the cache key drops stale entries"""
+    if orjson is not None:
+        return orjson.loads(Path(path).read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,28 @@
+"""
+Shared pytest fixtures
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def preprocessor():
+    """Preprocessor shared across the session, so NLTK data loads once"""
+    from src.preprocessing import ArticlePreprocessor
+    return ArticlePreprocessor()
+
+
+@pytest.fixture(scope="session")
+def sample_article():
+    """Sample article for testing (shared across the session; do not mutate)"""
+    return {
+        'article_id': 'test_001',
+        'source': 'Test News',
+        'date': '2021-01-01',
+        'title': 'Women in Leadership',
+        'content': 'Despite making up nearly half of the workforce, women hold only 21% of C-suite positions. This underrepresentation highlights barriers that women face.',
+        'human_coding': {
+            'underrepresentation': {'women': 1},
+            'obstacles': {'women': 1}
+        }
+    }
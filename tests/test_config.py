@@ -0,0 +1,82 @@
+"""
+Tests for configuration module
+"""
+
+import os
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.config import ConfigManager
+
+
+class TestConfigManager:
+    """Test cases for ConfigManager"""
+
+    @pytest.fixture
+    def config_dir(self, tmp_path):
+        """Config directory with a single YAML file"""
+        (tmp_path / "custom.yaml").write_text("section:\n  value: 1\n")
+        return tmp_path
+
+    def test_yaml_cache_written(self, config_dir):
+        """Test that parsed YAML is cached in a JSON sidecar"""
+        config = ConfigManager(config_dir).load_config('custom')
+
+        assert config == {'section': {'value': 1}}
+        assert (config_dir / ".custom.cache.json").exists()
+
+    def test_yaml_cache_invalidated(self, config_dir):
+        """Test that editing the YAML source bypasses a stale cache"""
+        ConfigManager(config_dir).load_config('custom')
+
+        config_path = config_dir / "custom.yaml"
+        config_path.write_text("section:\n  value: 2\n")
+        cache_mtime = (config_dir / ".custom.cache.json").stat().st_mtime
+        os.utime(config_path, (cache_mtime + 1, cache_mtime + 1))
+
+        config = ConfigManager(config_dir).load_config('custom')
+        assert config == {'section': {'value': 2}}
+
+    def test_yaml_cache_disabled(self, config_dir, monkeypatch):
+        """Test that the cache environment variable bypasses the sidecar"""
+        monkeypatch.setenv('SPAM_NEWS_DISABLE_YAML_CACHE', '1')
+        config = ConfigManager(config_dir).load_config('custom')
+
+        assert config == {'section': {'value': 1}}
+        assert not (config_dir / ".custom.cache.json").exists()
+
+    def test_schema_validation(self, tmp_path):
+        """Test that configs missing required structure are rejected"""
+        (tmp_path / "frame_definitions.yaml").write_text(
+            "frames:\n"
+            "  underrepresentation:\n"
+            "    definition: lower rates\n"
+            "    keywords: {strong: [underrepresented]}\n"
+        )
+
+        with pytest.raises(ValueError, match="frame_definitions"):
+            ConfigManager(tmp_path).load_config('frame_definitions')
+
+    def test_repo_configs_valid(self):
+        """Test that the shipped configs pass validation"""
+        config_manager = ConfigManager(Path(__file__).parent.parent / "configs")
+
+        for config_name in ['data_config', 'model_config', 'frame_definitions']:
+            assert config_manager.load_config(config_name)
+
+    def test_update_config(self, config_dir):
+        """Test that updates merge into nested sections without aliasing"""
+        config_manager = ConfigManager(config_dir)
+        updates = {'section': {'other': 3}, 'new': {'nested': {'value': 4}}}
+
+        config_manager.update_config('custom', updates)
+        updates['new']['nested']['value'] = 5
+
+        assert config_manager.load_config('custom') == {
+            'section': {'value': 1, 'other': 3},
+            'new': {'nested': {'value': 4}}
+        }
@@ -0,0 +1,204 @@
+"""
+Tests for data loading module
+"""
+
+import hashlib
+import json
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import data_loader
+from src.data_loader import ArticleDataLoader, DataCache, parse_human_coding
+
+
+class TestArticleDataLoader:
+    """Test cases for ArticleDataLoader"""
+
+    @pytest.fixture
+    def articles_file(self, tmp_path):
+        """Small articles file for testing"""
+        articles = [
+            {
+                'article_id': 'test_001',
+                'source': 'CNN',
+                'date': '2021-01-01',
+                'title': 'Women in Leadership',
+                'content': 'Despite making up nearly half of the workforce, women hold only 21% of C-suite positions.',
+                'human_coding': {
+                    'underrepresentation': {'women': 2},
+                    'obstacles': {'women_of_color': 1}
+                }
+            },
+            {
+                'article_id': 'test_002',
+                'source': 'NPR',
+                'date': '2021-02-01',
+                'title': 'Short',
+                'content': 'Too short.',
+                'human_coding': {}
+            }
+        ]
+        path = tmp_path / "articles.json"
+        path.write_text(json.dumps(articles))
+        return path
+
+    @pytest.fixture
+    def loader(self, articles_file):
+        """Create loader instance"""
+        return ArticleDataLoader(articles_file)
+
+    def test_load_articles(self, loader):
+        """Test article loading and derived columns"""
+        df = loader.load_articles()
+
+        assert len(df) == 2
+        assert list(df['word_count']) == [15, 2]
+        assert list(df['content_length']) == [89, 10]
+
+    def test_word_count_unicode_whitespace(self, tmp_path):
+        """Test that word counts split on the same whitespace as str.split"""
+        content = 'one\xa0two three\vfour'
+        path = tmp_path / "articles.json"
+        path.write_text(json.dumps([{'article_id': 'a', 'source': 'CNN', 'content': content}]))
+
+        df = ArticleDataLoader(path).load_articles()
+
+        assert df['word_count'].tolist() == [len(content.split())] == [4]
+
+    def test_get_coding_data(self, loader):
+        """Test human coding extraction"""
+        coding_df = loader.get_coding_data()
+
+        assert len(coding_df) == 2
+        row = coding_df.iloc[0]
+        assert row['article_id'] == 'test_001'
+        assert row['source'] == 'CNN'
+        assert row['frame_type'] == 'underrepresentation'
+        assert row['demographic_group'] == 'women'
+        assert row['count'] == 2
+        assert coding_df['frame_type'].dtype == 'category'
+
+    def test_load_articles_source_filter(self, loader):
+        """Test that filtering by source keeps only observed categories"""
+        df = loader.load_articles(source='NPR')
+
+        assert list(df['article_id']) == ['test_002']
+        assert df['source'].value_counts().to_dict() == {'NPR': 1}
+
+    def test_load_from_json_streaming(self, loader, articles_file):
+        """Test that streaming yields the same articles as a full load"""
+        streamed = list(loader.load_from_json_streaming(articles_file))
+
+        assert streamed == loader.load_from_json(articles_file)
+
+    def test_load_articles_streaming(self, loader, articles_file, monkeypatch):
+        """Test that a streamed load builds the same DataFrame chunk by chunk"""
+        monkeypatch.setattr(data_loader, '_STREAM_BATCH_SIZE', 1)
+        streamed = loader.load_articles(streaming=True)
+
+        assert loader._articles is None
+        assert streamed.equals(ArticleDataLoader(articles_file).load_articles())
+
+    @pytest.mark.parametrize('streaming', [False, True])
+    def test_load_articles_cached(self, loader, articles_file, streaming):
+        """Test that later loads and filters reuse the frame instead of re-reading the file"""
+        df = loader.load_articles(streaming=streaming)
+        articles_file.unlink()
+
+        assert loader.load_articles().equals(df)
+        assert list(loader.load_articles(source='CNN')['article_id']) == ['test_001']
+        assert loader.validate_data()['total_articles'] == 1
+
+    def test_load_articles_returns_copy(self, loader):
+        """Test that changes to a returned frame do not leak into later loads or accessors"""
+        df = loader.load_articles()
+        df['extra'] = 1
+        df.loc[0, 'word_count'] = -1
+
+        reloaded = loader.load_articles()
+        assert 'extra' not in reloaded.columns
+        assert list(reloaded['word_count']) == [15, 2]
+        assert len(loader.get_coding_data()) == 2
+        assert loader.validate_data()['total_articles'] == 2
+
+    def test_preprocessed_parquet_round_trip(self, loader, tmp_path):
+        """Test that saved Parquet data reloads with nested coding intact"""
+        df = loader.load_articles()
+        save_path = tmp_path / "processed" / "articles.parquet"
+        loader.save_preprocessed(save_path)
+
+        reloaded = ArticleDataLoader().load_preprocessed(save_path)
+
+        assert list(reloaded.columns) == list(df.columns)
+        assert reloaded['human_coding'].tolist() == df['human_coding'].tolist()
+        assert reloaded['content'].tolist() == df['content'].tolist()
+
+    def test_train_val_test_split(self, loader):
+        """Test that splits partition the articles reproducibly"""
+        df = loader.load_articles()
+        splits = loader.get_train_val_test_split(val_size=0.5, test_size=0.5)
+
+        ids = [article_id for split in splits for article_id in split['article_id']]
+        assert sorted(ids) == sorted(df['article_id'])
+
+        repeat = loader.get_train_val_test_split(val_size=0.5, test_size=0.5)
+        assert [list(s['article_id']) for s in repeat] == [list(s['article_id']) for s in splits]
+
+    def test_validate_data(self, loader):
+        """Test that short and uncoded articles are reported"""
+        report = loader.validate_data()
+
+        assert report['total_articles'] == 2
+        assert not report['is_valid']
+        assert report['issues'] == [
+            "Article test_002: Content too short or missing",
+            "Article test_002: No human coding"
+        ]
+
+
+class TestDataCache:
+    """Test cases for DataCache"""
+
+    def test_load_or_compute(self, tmp_path):
+        """Test that cached data is reused until the source file changes"""
+        data_path = tmp_path / "articles.json"
+        data_path.write_text("[]")
+        cache = DataCache(tmp_path / "cache")
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {'built': len(calls)}
+
+        assert cache.load_or_compute(str(data_path), build) == {'built': 1}
+        assert cache.load_or_compute(str(data_path), build) == {'built': 1}
+
+        data_path.write_text("[{}]")
+        assert cache.load_or_compute(str(data_path), build) == {'built': 2}
+
+    def test_cache_key_is_blake2b(self, tmp_path):
+        """Test that cache keys do not depend on which hash libraries are installed"""
+        cache = DataCache(tmp_path / "cache")
+        expected = hashlib.blake2b(b"missing.json_v2", digest_size=8).hexdigest()
+
+        assert cache._get_cache_key("missing.json", "v2") == expected
+
+
+def test_parse_human_coding():
+    """Test that unknown frames and malformed entries are dropped"""
+    parsed = parse_human_coding({
+        'underrepresentation': {'women': 2},
+        'obstacles': 'not a dict',
+        'unknown_frame': {'men': 1}
+    })
+
+    assert parsed == {
+        'underrepresentation': {'women': 2},
+        'overrepresentation': {},
+        'obstacles': {},
+        'successes': {}
+    }
@@ -0,0 +1,143 @@
+"""
+Tests for feature extraction module
+"""
+
+import numpy as np
+import pickle
+import pytest
+from scipy import sparse
+import subprocess
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import feature_extraction
+from src.feature_extraction import FrameFeatureExtractor
+
+
+class TestFrameFeatureExtractor:
+    """Test cases for FrameFeatureExtractor"""
+    
+    @pytest.fixture
+    def extractor(self):
+        """Create extractor instance"""
+        return FrameFeatureExtractor()
+    
+    @pytest.fixture
+    def sample_text(self):
+        """Sample text touching several frames and demographics"""
+        return ("The CEO, a Black woman, said women of color face barriers. Only 5 percent "
+                "of executives are Latina women; men hold 95%. She was promoted. Is this fair? "
+                "The vice president said minorities are underrepresented, not under-counted.")
+    
+    def test_lexical_features(self, extractor, sample_text):
+        """Test whole-word lexicon counts"""
+        features = extractor.extract_lexical_features(sample_text)
+        
+        assert features['underrepresentation_strong_count'] == 1
+        assert features['underrepresentation_moderate_count'] == 1
+        assert features['obstacles_structural_count'] == 0
+        assert features['successes_advancement_count'] == 1
+    
+    def test_demographic_features(self, extractor, sample_text):
+        """Test demographic term counts"""
+        features = extractor.extract_demographic_features(sample_text)
+        
+        assert features['demo_gender_women'] == 4
+        assert features['demo_race_black'] == 1
+        assert features['demo_intersectional_women_of_color'] == 2
+        assert features['demo_intersect_black_women'] == 1
+    
+    def test_sentence_features(self, extractor):
+        """Test that decimals do not split sentences and trailing text counts"""
+        features = extractor.extract_linguistic_features("Only 2.5 percent. Why? A trailing clause")
+        
+        assert features['ling_num_sentences'] == 3
+        assert features['ling_avg_sentence_length'] == pytest.approx(7 / 3)
+        assert extractor.extract_linguistic_features("")['ling_num_sentences'] == 0
+    
+    def test_statistical_features(self, extractor, sample_text):
+        """Test percentage parsing"""
+        features = extractor.extract_statistical_features(sample_text)
+        
+        assert features['stats_percentage_values'].tolist() == [5.0, 95.0]
+        assert features['stats_min_percentage'] == 5.0
+        assert features['stats_max_percentage'] == 95.0
+    
+    def test_context_features(self, extractor):
+        """Test that only frame terms inside a leadership window are counted"""
+        text = "The CEO faced a barrier. " + "Unrelated filler words. " * 5 + "A later success."
+        features = extractor.extract_context_features(text, window_size=30)
+        
+        assert features['context_leadership_mentions'] == 1
+        assert features['context_obstacles_near_leadership'] == 1
+        assert features['context_successes_near_leadership'] == 0
+    
+    @pytest.mark.parametrize('disabled', [('hyperscan',), ('hyperscan', 'ahocorasick')])
+    def test_term_scan_fallbacks_match(self, monkeypatch, sample_text, disabled):
+        """Test that the fallback term scans find the same terms as the preferred one"""
+        expected = FrameFeatureExtractor().extract_all_features(sample_text)
+        for module in disabled:
+            monkeypatch.setattr(feature_extraction, module, None)
+        
+        np.testing.assert_equal(FrameFeatureExtractor().extract_all_features(sample_text), expected)
+    
+    def test_pickle_round_trip(self, extractor, sample_text):
+        """Test that the extractor pickles, rebuilding its term scanner on load"""
+        restored = pickle.loads(pickle.dumps(extractor))
+        
+        if feature_extraction.hyperscan is not None:
+            assert restored._hs_db is not None
+        np.testing.assert_equal(restored.extract_all_features(sample_text),
+                                extractor.extract_all_features(sample_text))
+    
+    def test_extract_features_for_training(self, extractor, sample_text):
+        """Test batch feature matrix and label construction"""
+        segments = [{'text': sample_text}, {'content': 'No frames here.'}]
+        X, y = extractor.extract_features_for_training(segments, [['obstacles'], []])
+        
+        assert X.shape[0] == 2
+        assert y.tolist() == [[0, 0, 1, 0], [0, 0, 0, 0]]
+        
+        assert X.dtype == np.float32
+        assert X.shape[1] == len(extractor._lex_vocab) + len(extractor.feature_names)
+        
+        # Term columns hold whole-word counts
+        women = extractor._lex_vocab['women']
+        assert X[0, women] == 2
+        assert X[1, women] == 0
+        
+        # The matrix stays sparse, and its feature block matches the per-text vectors
+        assert sparse.issparse(X)
+        features = X[:, len(extractor._lex_vocab):].toarray()
+        np.testing.assert_allclose(features[0], extractor.extract_all_features_vec(sample_text),
+                                   rtol=1e-6)
+    
+    def test_feature_vector_layout(self, extractor, sample_text):
+        """Test that every scalar feature has a slot in the dense vector"""
+        features = extractor.extract_all_features(sample_text)
+        vec = extractor.extract_all_features_vec(sample_text)
+        
+        scalar_names = set(features) - {'stats_percentage_values'}
+        assert scalar_names <= set(extractor.feature_index)
+        for name in scalar_names:
+            assert vec[extractor.feature_index[name]] == pytest.approx(features[name])
+    
+    def test_conditional_features_omitted(self, extractor):
+        """Test that features that do not apply are left out of the dict"""
+        features = extractor.extract_all_features("No frames here.")
+        
+        assert 'stats_min_percentage' not in features
+        assert 'demo_intersect_black_women' not in features
+        assert 'context_obstacles_near_leadership' not in features
+        assert features['stats_percentage_values'].size == 0
+        assert isinstance(features['word_count'], int)
+
+
+def test_import_without_nltk():
+    """Test that importing the module does not load NLTK or the Punkt model"""
+    code = "import sys, src.feature_extraction; assert 'nltk' not in sys.modules"
+    subprocess.run([sys.executable, '-c', code], check=True,
+                   cwd=Path(__file__).parent.parent)
@@ -0,0 +1,214 @@
+"""
+Tests for frame detection module
+"""
+
+import contextlib
+import subprocess
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.frame_detection import (
+    EnsembleFrameDetector, FrameAnalyzer, TransformerFrameDetector, ZeroShotFrameDetector
+)
+
+
+class StubDetector:
+    """Detector returning fixed probabilities for every text"""
+
+    def __init__(self, scores):
+        self.scores = scores
+
+    def predict_proba(self, text):
+        if isinstance(text, str):
+            return dict(self.scores)
+        return [dict(self.scores) for _ in text]
+
+
+class FakeTensor:
+    """Just enough of a tensor for TransformerFrameDetector.predict"""
+
+    def __init__(self, values):
+        self.values = np.asarray(values, dtype=np.float64)
+
+    def cpu(self):
+        return self
+
+    def numpy(self):
+        return self.values
+
+
+class FakeBatch(dict):
+    """Tokenizer output that can be moved to a device"""
+
+    def to(self, device):
+        return self
+
+
+@pytest.fixture
+def fake_torch(monkeypatch):
+    """Minimal torch stand-in recording inference_mode use"""
+    torch = types.ModuleType('torch')
+    torch.entered = []
+
+    @contextlib.contextmanager
+    def inference_mode():
+        torch.entered.append(True)
+        yield
+
+    torch.inference_mode = inference_mode
+    torch.sigmoid = lambda tensor: FakeTensor(1 / (1 + np.exp(-tensor.values)))
+    monkeypatch.setitem(sys.modules, 'torch', torch)
+    return torch
+
+
+class TestEnsembleFrameDetector:
+    """Test cases for EnsembleFrameDetector"""
+
+    def test_predict_proba_weighted(self):
+        """Test that scores are the weighted sum over detectors"""
+        ensemble = EnsembleFrameDetector(
+            [StubDetector({'obstacles': 0.8, 'successes': 0.2}),
+             StubDetector({'obstacles': 0.4, 'successes': 0.6})],
+            weights=[0.75, 0.25]
+        )
+
+        assert ensemble.predict_proba("text") == pytest.approx({'obstacles': 0.7, 'successes': 0.3})
+        assert ensemble.predict(["a", "b"])[1]['frames'] == ['obstacles']
+
+    def test_predict_proba_frames_follow_first_detector(self):
+        """Test that missing scores count as 0 and the first detector's frames are reported"""
+        ensemble = EnsembleFrameDetector(
+            [StubDetector({'successes': 0.4, 'obstacles': 1.0}),
+             StubDetector({'obstacles': 0.5, 'underrepresentation': 0.9})]
+        )
+
+        probs = ensemble.predict_proba(["a", "b"])
+
+        assert len(probs) == 2
+        assert list(probs[0]) == ['successes', 'obstacles']
+        assert probs[0] == pytest.approx({'successes': 0.2, 'obstacles': 0.75})
+
+
+class TestFrameAnalyzer:
+    """Test cases for FrameAnalyzer"""
+
+    def test_aggregate_results(self):
+        """Test that scores are averaged over the segments that scored each frame"""
+        analyzer = FrameAnalyzer(detector=None)
+        results = [
+            {'frames': ['obstacles'], 'scores': {'obstacles': 0.9, 'successes': 0.1},
+             'demographics': ['women']},
+            {'frames': ['obstacles', 'successes'], 'scores': {'obstacles': 0.5},
+             'demographics': ['women', 'men']}
+        ]
+
+        aggregated = analyzer._aggregate_results(results)
+
+        assert aggregated['scores'] == pytest.approx({
+            'underrepresentation': 0.0, 'overrepresentation': 0.0,
+            'obstacles': 0.7, 'successes': 0.1
+        })
+        assert aggregated['counts']['frames'] == {'obstacles': 2, 'successes': 1}
+        assert sorted(aggregated['demographics']) == ['men', 'women']
+
+    def test_aggregate_results_preprocessed_demographics(self, preprocessor):
+        """Test that the preprocessor's group -> matches dict counts groups per segment"""
+        demographics = preprocessor.detect_demographics("Women and women leaders; men too.")
+        analyzer = FrameAnalyzer(detector=None)
+        results = [{'frames': [], 'scores': {}, 'demographics': demographics}] * 2
+
+        aggregated = analyzer._aggregate_results(results)
+
+        assert aggregated['counts']['demographics'] == {'women': 2, 'men': 2}
+        assert aggregated['demographics'] == ['women', 'men']
+
+
+class TestZeroShotFrameDetector:
+    """Test cases for ZeroShotFrameDetector, with the pipeline stubbed out"""
+
+    def test_classify_in_one_call(self):
+        """Test that all texts go to the pipeline at once and labels map back to frames"""
+        detector = ZeroShotFrameDetector.__new__(ZeroShotFrameDetector)
+        detector.frame_labels = {'obstacles': 'barriers', 'successes': 'achievements'}
+        detector._candidate_labels = list(detector.frame_labels.values())
+        detector._label_to_frame = {v: k for k, v in detector.frame_labels.items()}
+        detector.threshold = 0.5
+        calls = []
+
+        def classifier(texts, candidate_labels, multi_label):
+            calls.append(texts)
+            return [{'labels': ['achievements', 'barriers'], 'scores': [0.7, 0.2]} for _ in texts]
+
+        detector.classifier = classifier
+        results = detector.predict(["a", "b", "c"])
+
+        assert calls == [["a", "b", "c"]]
+        assert results[0] == {'frames': ['successes'],
+                              'scores': {'successes': 0.7, 'obstacles': 0.2}}
+
+
+class TestTransformerFrameDetector:
+    """Test cases for TransformerFrameDetector, with torch and the model stubbed out"""
+
+    @pytest.fixture
+    def detector(self):
+        """Detector with a fake tokenizer and model recording batch sizes"""
+        detector = TransformerFrameDetector.__new__(TransformerFrameDetector)
+        detector.device = 'cpu'
+        detector.batch_size = 2
+        detector.frame_labels = ['underrepresentation', 'overrepresentation',
+                                 'obstacles', 'successes']
+        detector.threshold = 0.5
+        detector.batches = []
+
+        def tokenizer(texts, **kwargs):
+            detector.batches.append(len(texts))
+            return FakeBatch(n=len(texts))
+
+        detector.tokenizer = tokenizer
+        detector.model = lambda n: types.SimpleNamespace(logits=FakeTensor([[2.0, -2.0, 0.0, -1.0]] * n))
+        return detector
+
+    def test_predict_batches(self, detector, fake_torch):
+        """Test that texts run in batch_size chunks under inference_mode"""
+        results = detector.predict(["a", "b", "c"])
+
+        assert detector.batches == [2, 1]
+        assert fake_torch.entered == [True]
+        assert len(results) == 3
+        assert results[0]['frames'] == ['underrepresentation', 'obstacles']
+        assert detector.predict_proba("a")['underrepresentation'] == pytest.approx(1 / (1 + np.exp(-2)))
+
+    def test_compile_model(self, detector, fake_torch):
+        """Test that torch.compile wraps the model and failures keep eager mode"""
+        model = detector.model
+
+        detector._compile_model()
+        assert detector.model is model
+
+        fake_torch.compile = lambda m, mode, dynamic: ('compiled', m, mode, dynamic)
+        detector._compile_model()
+        assert detector.model == ('compiled', model, 'default', True)
+
+        def fail(m, mode, dynamic):
+            raise RuntimeError("no backend")
+
+        detector.model = model
+        fake_torch.compile = fail
+        detector._compile_model()
+        assert detector.model is model
+
+
+def test_import_without_torch():
+    """Test that the module imports without torch or transformers installed"""
+    code = ("import sys; sys.modules['torch'] = None; sys.modules['transformers'] = None; "
+            "import src.frame_detection")
+    subprocess.run([sys.executable, '-c', code], check=True,
+                   cwd=Path(__file__).parent.parent)
@@ -2,7 +2,9 @@
 Tests for preprocessing module
 """
 
+import pickle
 import pytest
+import re
 import sys
 from pathlib import Path
 
@@ -15,26 +17,6 @@ from src.preprocessing import ArticlePreprocessor
 class TestArticlePreprocessor:
     """Test cases for ArticlePreprocessor"""
     
-    @pytest.fixture
-    def preprocessor(self):
-        """Create preprocessor instance"""
-        return ArticlePreprocessor()
-    
-    @pytest.fixture
-    def sample_article(self):
-        """Sample article for testing"""
-        return {
-            'article_id': 'test_001',
-            'source': 'Test News',
-            'date': '2021-01-01',
-            'title': 'Women in Leadership',
-            'content': 'Despite making up nearly half of the workforce, women hold only 21% of C-suite positions. This underrepresentation highlights barriers that women face.',
-            'human_coding': {
-                'underrepresentation': {'women': 1},
-                'obstacles': {'women': 1}
-            }
-        }
-    
     def test_clean_text(self, preprocessor):
         """Test text cleaning"""
         # Test URL removal
@@ -48,10 +30,11 @@ class TestArticlePreprocessor:
         assert cleaned == "This has extra spaces"
         
         # Test quote normalization
-        text = "She said "hello" to the 'world'"
+        text = "She said \u201chello\u201d to the \u2018world\u2019"
         cleaned = preprocessor.clean_text(text)
         assert '"' in cleaned
         assert "'" in cleaned
+        assert cleaned == "She said \"hello\" to the 'world'"
     
     def test_extract_sentences(self, preprocessor):
         """Test sentence extraction"""
@@ -98,6 +81,15 @@ class TestArticlePreprocessor:
         assert len(comparisons) > 0
         assert any(s['value'] == '3' for s in comparisons)
     
+    def test_extract_statistics_unicode(self, preprocessor):
+        """Test that NBSP separators and non-ASCII digits are matched"""
+        stats = preprocessor.extract_statistics("Only 21\xa0percent of CEOs; \u0662\u0661% of boards.")
+        
+        assert [stat['value'] for stat in stats] == ['21', '\u0662\u0661']
+        
+        comparisons = preprocessor.extract_statistics("Men are 3\xa0times\xa0more likely")
+        assert [(stat['value'], stat['direction']) for stat in comparisons] == [('3', 'more')]
+    
     def test_identify_frame_candidates(self, preprocessor):
         """Test frame candidate identification"""
         text = "Women are underrepresented in leadership, facing barriers to advancement, but some have achieved breakthrough successes."
@@ -113,6 +105,18 @@ class TestArticlePreprocessor:
         assert any('barriers' in c for c in candidates['obstacles'])
         assert any('breakthrough' in c for c in candidates['successes'])
     
+    def test_frame_indicator_plurals(self, preprocessor):
+        """Test that noun indicators match their plurals and nothing else does"""
+        fallback = ArticlePreprocessor()
+        fallback._frames_automaton = None
+        
+        for scanner in (preprocessor, fallback):
+            assert list(scanner.identify_frame_candidates("Ceilings and biases remain.")) == ['obstacles']
+            assert list(scanner.identify_frame_candidates("Milestones were reached.")) == ['successes']
+            assert list(scanner.identify_frame_candidates("Few minorities advance.")) == ['underrepresentation']
+            assert scanner.identify_frame_candidates("Barriered streets and biased rulers.") == {}
+            assert scanner.identify_frame_candidates("Onlys, mosts and barrierses.") == {}
+    
     def test_preprocess_article(self, preprocessor, sample_article):
         """Test full preprocessing pipeline"""
         processed = preprocessor.preprocess_article(sample_article)
@@ -130,4 +134,65 @@ class TestArticlePreprocessor:
         
         # Check that frame candidates were identified
         assert 'underrepresentation' in processed['frame_candidates']
-        assert 'obstacles' in processed['frame_candidates']
\ No newline at end of file
+        assert 'obstacles' in processed['frame_candidates']
+    
+    def test_analyze_text(self, preprocessor, sample_article):
+        """Test that the combined scan matches the individual methods"""
+        text = sample_article['content']
+        
+        assert preprocessor.analyze_text(text) == {
+            'leadership_contexts': preprocessor.find_leadership_context(text),
+            'demographics_found': preprocessor.detect_demographics(text),
+            'statistics': preprocessor.extract_statistics(text),
+            'frame_candidates': preprocessor.identify_frame_candidates(text)
+        }
+    
+    def test_preprocess_batch(self, preprocessor, sample_article):
+        """Test that batch preprocessing matches per-article results"""
+        articles = [sample_article, dict(sample_article, article_id='test_002')]
+        
+        batch = preprocessor.preprocess_batch(articles, n_workers=2)
+        
+        assert batch == [preprocessor.preprocess_article(a) for a in articles]
+    
+    def test_preprocess_batch_uses_instance(self, sample_article):
+        """Test that worker processes run this preprocessor, not a fresh one"""
+        custom = ArticlePreprocessor()
+        custom._percent_re = re.compile(r'(\d+) pct')
+        articles = [dict(sample_article, article_id=f'test_{i}', content='Women hold 21 pct of seats.')
+                    for i in range(2)]
+        
+        batch = custom.preprocess_batch(articles, n_workers=2)
+        
+        assert [[stat['value'] for stat in p['statistics']] for p in batch] == [['21'], ['21']]
+    
+    def test_pickle_round_trip(self, preprocessor, sample_article):
+        """Test that a used preprocessor pickles and gives the same results"""
+        processed = preprocessor.preprocess_article(sample_article)
+        examples = preprocessor.create_training_examples(processed)
+        
+        restored = pickle.loads(pickle.dumps(preprocessor))
+        
+        assert restored.preprocess_article(sample_article) == processed
+        assert restored.create_training_examples(processed) == examples
+    
+    def test_paragraph_cache_scope(self, sample_article):
+        """Test that only training-example paragraphs are cached, not whole articles"""
+        fresh = ArticlePreprocessor()
+        processed = fresh.preprocess_article(sample_article)
+        assert fresh._paragraph_cache == {}
+        
+        examples = fresh.create_training_examples(dict(processed, paragraphs=['The CEO and women on the board.']))
+        
+        assert examples[0]['demographics'] == ['women']
+        assert fresh._paragraph_cache == {'the ceo and women on the board.': ('women',)}
+    
+    def test_term_scan_fallbacks_match(self, preprocessor, sample_article):
+        """Test that the regex fallbacks match the Aho-Corasick scans"""
+        text = sample_article['content'] + " The CEO and vice president cite biases; most boards hold most seats."
+        fallback = ArticlePreprocessor()
+        fallback._frames_automaton = None
+        fallback._leadership_automaton = None
+        
+        assert fallback.identify_frame_candidates(text) == preprocessor.identify_frame_candidates(text)
+        assert fallback.find_leadership_context(text) == preprocessor.find_leadership_context(text)
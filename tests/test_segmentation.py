@@ -0,0 +1,102 @@
+"""
+Tests for segmentation module
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.segmentation import ArticleSegmenter
+
+
+class TestArticleSegmenter:
+    """Test cases for ArticleSegmenter"""
+
+    @pytest.fixture
+    def segmenter(self):
+        """Create segmenter instance"""
+        return ArticleSegmenter()
+
+    def test_quote_then_attribution(self, segmenter):
+        """Test '"Quote," said Person' quotes"""
+        quotes = segmenter.extract_quotes('"We need more women leading," said Jane Doe. Then more.')
+
+        assert [(q['text'], q['attribution']) for q in quotes] == [
+            ('We need more women leading,', 'Jane Doe')
+        ]
+
+    def test_speaker_then_quote(self, segmenter):
+        """Test that 'Person said, "Quote"' reports the speaker as the attribution"""
+        quotes = segmenter.extract_quotes('Jane Doe said, "We need more women leading."')
+
+        assert [(q['text'], q['attribution']) for q in quotes] == [
+            ('We need more women leading.', 'Jane Doe')
+        ]
+
+    def test_quote_attribution_unicode_spaces(self, segmenter):
+        """Test that attribution separated by non-breaking spaces still matches"""
+        quotes = segmenter.extract_quotes('"Boards must change,"\xa0said\xa0Jane Doe.')
+
+        assert [(q['text'], q['attribution']) for q in quotes] == [('Boards must change,', 'Jane Doe')]
+
+    def test_bare_quote(self, segmenter):
+        """Test that unattributed quotes need at least 20 characters"""
+        quotes = segmenter.extract_quotes('A "short one" and a "much longer quotation here" end')
+
+        assert [(q['text'], q['attribution']) for q in quotes] == [('much longer quotation here', None)]
+
+    def test_sliding_windows(self, segmenter):
+        """Test window boundaries, the tail window and character offsets"""
+        sentences = ['Sentence zero.', 'Sentence one!', 'Two?', 'Sentence three.', 'Four.', 'Five and last.']
+        joined = ' '.join(sentences)
+
+        windows = segmenter.create_sliding_windows(sentences)
+
+        assert [(w['start_idx'], w['end_idx'], w['window_id']) for w in windows] == [
+            (0, 2, 0), (2, 4, 1), (4, 5, 2)
+        ]
+        assert [(w['char_start'], w['char_end']) for w in windows] == [(0, 33), (29, 55), (50, 70)]
+        for window in windows:
+            assert window['text'] == ' '.join(window['sentences'])
+            assert joined[window['char_start']:window['char_end']] == window['text']
+
+    def test_sliding_windows_short_input(self, segmenter):
+        """Test that inputs up to the window size give a single window"""
+        windows = segmenter.create_sliding_windows(['Only one sentence.', 'And two.'])
+
+        assert windows == [{
+            'text': 'Only one sentence. And two.',
+            'sentences': ['Only one sentence.', 'And two.'],
+            'start_idx': 0, 'end_idx': 1,
+            'char_start': 0, 'char_end': 27,
+            'window_id': 0
+        }]
+        assert segmenter.create_sliding_windows([])[0]['text'] == ''
+
+    def test_segment_around_keywords(self, segmenter):
+        """Test whole-word, case-insensitive hits trimmed to the nearest sentence ends"""
+        text = 'Boards met. The CEO spoke on leadership today. CEOs elsewhere stayed quiet. Another ceo agreed.'
+
+        segments = segmenter.segment_around_keywords(text, ['CEO', 'leadership'], context_size=20)
+
+        assert [(s['text'], s['keyword'], s['keyword_position'], s['original_position'])
+                for s in segments] == [
+            ('The CEO spoke on leadership', 'CEO', 5, (11, 39)),
+            ('Another ceo agreed.', 'CEO', 9, (75, 95)),
+            ('The CEO spoke on leadership today.', 'leadership', 18, (11, 46))
+        ]
+        assert [s['segment_id'] for s in segments] == [0, 1, 2]
+
+    def test_segment_for_analysis_reuses_preprocessed(self, segmenter, preprocessor, sample_article):
+        """Test that a preprocessed article's sentences and paragraphs are reused as-is"""
+        processed = preprocessor.preprocess_article(sample_article)
+
+        segments = segmenter.segment_for_analysis(processed)
+
+        assert segments['sentences'] is processed['sentences']
+        assert segments['paragraphs'] is processed['paragraphs']
+        assert segments['sentences'] == segmenter.segment_by_sentences(processed['cleaned_content'])
+        assert segments['paragraphs'] == segmenter.segment_by_paragraphs(processed['cleaned_content'])
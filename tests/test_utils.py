@@ -0,0 +1,154 @@
+"""
+Tests for utils module
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sys
+from datetime import date, datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import utils
+from src.utils import (
+    Timer, calculate_agreement_metrics, calculate_icc, create_frame_summary,
+    hash_text, load_config, save_results
+)
+
+
+class TestSaveResults:
+    """Test cases for save_results"""
+
+    @pytest.fixture(params=['orjson', 'json'])
+    def writer(self, request, monkeypatch):
+        """Run each test with orjson (when installed) and with the json fallback"""
+        if request.param == 'json':
+            monkeypatch.setattr(utils, 'orjson', None)
+        elif utils.orjson is None:
+            pytest.skip("orjson not installed")
+        return request.param
+
+    def test_json_round_trip(self, writer, tmp_path):
+        """Test that NumPy values, NaN and dates load back the same with either writer"""
+        path = tmp_path / "results" / "results.json"
+        save_results({
+            'array': np.array([[1, 2], [3, 4]], dtype=np.int64),
+            'floats': np.array([0.5, np.nan]),
+            'int': np.int64(3),
+            'float': np.float32(0.25),
+            'flag': np.bool_(True),
+            'nan': float('nan'),
+            'scores': [np.float64(np.nan), 1.5],
+            'created': datetime(2021, 1, 2, 3, 4, 5),
+            'day': date(2021, 1, 2),
+            'timestamp': pd.Timestamp('2021-01-02 03:04:05'),
+            'path': Path('data/articles.json')
+        }, path)
+
+        assert json.loads(path.read_text()) == {
+            'array': [[1, 2], [3, 4]],
+            'floats': [0.5, None],
+            'int': 3,
+            'float': 0.25,
+            'flag': True,
+            'nan': None,
+            'scores': [None, 1.5],
+            'created': '2021-01-02T03:04:05',
+            'day': '2021-01-02',
+            'timestamp': '2021-01-02T03:04:05',
+            'path': str(Path('data/articles.json'))
+        }
+
+    def test_unsupported_format(self, tmp_path):
+        """Test that unknown formats are rejected"""
+        with pytest.raises(ValueError):
+            save_results({}, tmp_path / "results.xml", format='xml')
+
+
+def test_hash_text():
+    """Test that text hashes are stable blake2b digests"""
+    assert hash_text("test text") == hashlib.blake2b(b"test text", digest_size=16).hexdigest()
+    assert hash_text("test text") != hash_text("test text.")
+
+
+def test_calculate_icc():
+    """Test ICC(2,1) on two raters"""
+    assert calculate_icc([1, 0, 1, 1, 0], [1, 0, 1, 0, 0]) == pytest.approx(0.905, abs=1e-3)
+    assert calculate_icc(np.array([2, 4, 6]), np.array([2, 4, 6])) == pytest.approx(1.0)
+
+    with pytest.raises(ValueError):
+        calculate_icc([1, 0], [1])
+
+
+def test_calculate_agreement_metrics():
+    """Test per-frame and overall agreement over the shorter of the two lists"""
+    predictions = [{'frames': ['obstacles']}, {'frames': ['successes', 'obstacles']}, {}]
+    ground_truth = [{'frames': ['obstacles']}, {'frames': ['successes']},
+                    {'frames': ['obstacles']}, {'frames': ['successes']}]
+
+    metrics = calculate_agreement_metrics(predictions, ground_truth)
+
+    assert metrics['obstacles_precision'] == pytest.approx(0.5)
+    assert metrics['obstacles_recall'] == pytest.approx(0.5)
+    assert metrics['successes_f1'] == pytest.approx(1.0)
+    assert metrics['successes_kappa'] == pytest.approx(1.0)
+    assert metrics['underrepresentation_f1'] == 0
+    assert metrics['overall_precision'] == pytest.approx(2 / 3)
+    assert metrics['overall_recall'] == pytest.approx(2 / 3)
+    assert metrics['overall_accuracy'] == pytest.approx(10 / 12)
+
+
+def test_create_frame_summary():
+    """Test that the summary keeps frame/demographic order and drops empty or unknown groups"""
+    coding_data = pd.DataFrame({
+        'article_id': ['a1', 'a2', 'a1', 'a1', 'a2', 'a3'],
+        'frame_type': ['obstacles', 'obstacles', 'underrepresentation', 'successes',
+                       'unknown', 'obstacles'],
+        'demographic_group': ['women', 'women', 'men', 'women', 'women', 'others'],
+        'count': [1, 2, 3, 0, 5, 1]
+    })
+
+    summary = create_frame_summary(coding_data)
+
+    assert summary.to_dict('records') == [
+        {'frame': 'underrepresentation', 'demographic': 'men', 'total_count': 3, 'num_articles': 1},
+        {'frame': 'obstacles', 'demographic': 'women', 'total_count': 3, 'num_articles': 2}
+    ]
+
+
+def test_load_config(tmp_path):
+    """Test that configs are parsed once per file version and returned as copies"""
+    path = tmp_path / "config.yaml"
+    path.write_text("model:\n  name: first\n")
+
+    config = load_config(path)
+    config['model']['name'] = 'changed'
+    assert load_config(path) == {'model': {'name': 'first'}}
+
+    path.write_text("model:\n  name: second\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(path) == {'model': {'name': 'second'}}
+
+    with pytest.raises(FileNotFoundError):
+        load_config(tmp_path / "missing.yaml")
+
+
+def test_timer(monkeypatch, caplog):
+    """Test that Timer logs the elapsed time in seconds"""
+    ticks = iter([1_000_000_000, 2_500_000_000])
+    monkeypatch.setattr(utils.time, 'perf_counter_ns', lambda: next(ticks))
+
+    with caplog.at_level(logging.INFO, logger=utils.__name__):
+        with Timer("Loading"):
+            pass
+
+    assert caplog.messages == ["Loading took 1.50 seconds"]